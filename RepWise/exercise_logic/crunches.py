@@ -1,20 +1,22 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_EAR, LEFT_SHOULDER, LEFT_HIP
+from utils import STATE_UP, STATE_DOWN
 
 
-def process_crunches(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_crunches(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Crunches.
     Checks the head-shoulder-hip angle for torso curl/lift.
     """
 
     # Get 3D coordinates
-    left_ear_3d = get_landmark_3d(landmarks, "LEFT_EAR")
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
+    left_ear_3d = lm[LEFT_EAR, :3]
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_hip_3d = lm[LEFT_HIP, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
 
     # Calculate angle (Angle at shoulder to measure how much the torso is curling)
     # A smaller angle indicates a tighter curl/crunch.
@@ -31,20 +33,20 @@ def process_crunches(image, landmarks, frame_width, frame_height, rep_counter, e
 
     # At peak contraction/curl
     if curl_angle < CRUNCH_PEAK_THRESHOLD:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Squeeze! Lower slowly."
             torso_line_color = GOOD_COLOR
 
     # At floor (repetition complete)
-    elif curl_angle > CRUNCH_FLOOR_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif curl_angle > CRUNCH_FLOOR_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Curl up."
         torso_line_color = GOOD_COLOR
 
     # In between, not high enough
-    elif exercise_state == "down" and curl_angle > CRUNCH_PEAK_THRESHOLD:
+    elif exercise_state == STATE_DOWN and curl_angle > CRUNCH_PEAK_THRESHOLD:
         feedback_text = "Curl higher! Lift your shoulders."
         torso_line_color = BAD_COLOR
 
@@ -1,28 +1,29 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
+from utils import calculate_angles, angle_triples, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
     TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Measures hip hinge
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),  # Measures knee bend
+)
 
-def process_deadlift(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_deadlift(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Deadlift.
     Checks for hip hinge vs. squat and back straightness.
     """
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
+    left_ankle_2d = lm2[LEFT_ANKLE]
 
     # Calculate angles
-    hip_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)  # Measures hip hinge
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)  # Measures knee bend
+    hip_angle, knee_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     HIP_HINGE_THRESHOLD = 90  # Hips hinged over
@@ -48,18 +49,18 @@ def process_deadlift(image, landmarks, frame_width, frame_height, rep_counter, e
 
     # At bottom of hinge with good form
     if hip_angle < HIP_HINGE_THRESHOLD and knee_angle > KNEE_BEND_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Good position! Drive up."
 
     # Standing up (lockout)
-    elif hip_angle > HIP_STRAIGHT_THRESHOLD and knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif hip_angle > HIP_STRAIGHT_THRESHOLD and knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Lockout."
 
     # Standing, waiting
-    elif exercise_state == "up" and hip_angle > HIP_STRAIGHT_THRESHOLD:
+    elif exercise_state == STATE_UP and hip_angle > HIP_STRAIGHT_THRESHOLD:
         if "squat" not in feedback_text:  # Don't overwrite bad form cue
             feedback_text = "Hinge at your hips to lower."
 
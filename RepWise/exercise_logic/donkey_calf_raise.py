@@ -1,27 +1,28 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_HIP, LEFT_KNEE, LEFT_ANKLE, LEFT_FOOT_INDEX
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_KNEE, LEFT_ANKLE, LEFT_FOOT_INDEX),  # Knee-Ankle-Foot_Index
+    (LEFT_ANKLE, LEFT_HIP, LEFT_KNEE),  # Ankle-Hip-Knee (Checks for hinge)
+)
 
-def process_donkey_calf_raise(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_donkey_calf_raise(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Donkey Calf Raise.
     Checks ankle angle for height and hip angle for hinge position.
     """
 
-    # Get 3D coordinates
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-    left_foot_index_3d = get_landmark_3d(landmarks, "LEFT_FOOT_INDEX")
-
     # Get 2D coordinates
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
-    left_foot_index_2d = get_landmark_coords(landmarks, "LEFT_FOOT_INDEX", frame_width, frame_height)
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
+    left_ankle_2d = lm2[LEFT_ANKLE]
+    left_foot_index_2d = lm2[LEFT_FOOT_INDEX]
 
     # Calculate angles
-    ankle_angle = calculate_angle(left_knee_3d, left_ankle_3d, left_foot_index_3d) # Knee-Ankle-Foot_Index
-    hip_angle = calculate_angle(left_ankle_3d, left_hip_3d, left_knee_3d) # Ankle-Hip-Knee (Checks for hinge)
+    ankle_angle, hip_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     ANKLE_CONTRACTION_THRESHOLD = 90  # Max dorsiflexion/bottom stretch (lower angle = toes down)
@@ -43,18 +44,18 @@ def process_donkey_calf_raise(image, landmarks, frame_width, frame_height, rep_c
     # 2. Count Reps (State Machine)
     # At top (contraction)
     if ankle_angle > ANKLE_PEAK_THRESHOLD and hip_angle < HIP_HINGE_THRESHOLD:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Squeeze! Lower slowly."
 
     # At bottom (stretch)
-    elif ankle_angle < ANKLE_CONTRACTION_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif ankle_angle < ANKLE_CONTRACTION_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Drive up."
 
     # In between, not high enough
-    elif exercise_state == "down" and ankle_angle < ANKLE_PEAK_THRESHOLD:
+    elif exercise_state == STATE_DOWN and ankle_angle < ANKLE_PEAK_THRESHOLD:
         if "Hinge" not in feedback_text:
             feedback_text = "Push up onto your toes!"
         ankle_line_color = BAD_COLOR
@@ -1,7 +1,9 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE
+from utils import STATE_UP, STATE_DOWN
 
 
-def process_glute_bridge(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_glute_bridge(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Glute Bridge.
     Checks the hip extension angle (shoulder-hip-knee line).
@@ -9,14 +11,14 @@ def process_glute_bridge(image, landmarks, frame_width, frame_height, rep_counte
     """
 
     # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_hip_3d = lm[LEFT_HIP, :3]
+    left_knee_3d = lm[LEFT_KNEE, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angle: Hip extension (Angle at Hip, should be near 180 at top)
     extension_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
@@ -37,18 +39,18 @@ def process_glute_bridge(image, landmarks, frame_width, frame_height, rep_counte
 
     # At top (max extension)
     if extension_angle > HIP_TOP_THRESHOLD:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Good squeeze! Lower with control."
 
     # At bottom
-    elif extension_angle < HIP_BOTTOM_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif extension_angle < HIP_BOTTOM_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Drive hips up."
 
     # In between, not high enough
-    elif exercise_state == "down" and extension_angle > HIP_BOTTOM_THRESHOLD:
+    elif exercise_state == STATE_DOWN and extension_angle > HIP_BOTTOM_THRESHOLD:
         feedback_text = "Push your hips higher!"
         line_color = BAD_COLOR
 
@@ -1,7 +1,17 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN, STATE_RECOVERING
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # 1. Hinge Angle (Shoulder-Hip-Knee) - Torso/Leg angle. Smaller angle means more hinged.
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    # 2. Knee Stability (Hip-Knee-Ankle) - Should be maintained near 175 (slight bend)
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+)
 
-def process_good_mornings(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_good_mornings(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Good Mornings.
     Checks the hip hinge depth and knee stability.
@@ -10,23 +20,13 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
     # Initialize speech text for this frame
     speech_text = ""
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    # 1. Hinge Angle (Shoulder-Hip-Knee) - Torso/Leg angle. Smaller angle means more hinged.
-    hinge_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
-
-    # 2. Knee Stability (Hip-Knee-Ankle) - Should be maintained near 175 (slight bend)
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)
+    hinge_angle, knee_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_BEND_MIN_THRESHOLD = 160
@@ -58,7 +58,7 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
     # 2. Rep Counting (State Machine)
 
     # State 1: UP (Ready to start or Rep Complete)
-    if exercise_state == "up":
+    if exercise_state == STATE_UP:
         if hinge_angle > HINGE_TOP_THRESHOLD:
             # Fully standing, ready to start
             if current_feedback == "":
@@ -68,7 +68,7 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
 
             # TRANSITION: UP -> DOWN (Start Hinging)
             if hinge_angle < HINGE_START_THRESHOLD and is_good_knee:
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Lower your chest, maintain a flat back."
                 speech_text = "Lower."
 
@@ -76,7 +76,7 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
             # FIX: User is bent over (hinge_angle < HINGE_TOP_THRESHOLD) but state is "up"
             if hinge_angle < HINGE_START_THRESHOLD and is_good_knee:
                 # If we are already bent past the starting point, immediately transition to "down"
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Continue lowering to hit depth."
                 speech_text = "Lower."
             else:
@@ -85,10 +85,10 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
                 hinge_line_color = BAD_COLOR
 
     # State 2: DOWN (Rep in progress - focusing on achieving depth)
-    elif exercise_state == "down":
+    elif exercise_state == STATE_DOWN:
         if hinge_angle < HINGE_BOTTOM_THRESHOLD:
             # REACHED DEPTH: Now transition to RECOVERING state
-            exercise_state = "recovering"
+            exercise_state = STATE_RECOVERING
             if current_feedback == "":
                 current_feedback = "Good depth! Drive up slowly using glutes."
                 if speech_text == "":
@@ -102,11 +102,11 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
                 hinge_line_color = BAD_COLOR
 
     # State 3: RECOVERING (Coming up from the bottom)
-    elif exercise_state == "recovering":
+    elif exercise_state == STATE_RECOVERING:
         # Check for full lockout (Rep completion)
         if hinge_angle > HINGE_TOP_THRESHOLD and is_good_knee:
             # TRANSITION: RECOVERING -> UP (Rep Count)
-            exercise_state = "up"
+            exercise_state = STATE_UP
             rep_counter += 1
             current_feedback = "Rep Complete! Hinge forward for the next one."
             speech_text = "Rep complete."
@@ -126,7 +126,7 @@ def process_good_mornings(image, landmarks, frame_width, frame_height, rep_count
     # Draw body lines
     cv2.line(image, left_shoulder_2d, left_hip_2d, hinge_line_color, 4)
     cv2.line(image, left_hip_2d, left_knee_2d, hinge_line_color, 4)
-    cv2.line(image, left_knee_2d, get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height),
+    cv2.line(image, left_knee_2d, lm2[LEFT_ANKLE],
              knee_line_color, 4)
 
     # Draw circles on joints
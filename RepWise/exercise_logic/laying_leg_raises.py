@@ -1,30 +1,30 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # 1. Leg Straightness (Angle at knee)
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+    # 2. Leg Lift Height (Angle at hip, relative to torso/floor)
+    # The shoulder-hip-knee angle measures how far the leg is from the torso line (straight line = 180)
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+)
 
-def process_laying_leg_raises(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_laying_leg_raises(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Laying Leg Raises.
     Checks the hip-knee-ankle angle (for straight legs) and shoulder-hip-knee angle (for lift height).
     """
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-
     # Get 2D coordinates
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
+    left_ankle_2d = lm2[LEFT_ANKLE]
 
     # Calculate angles
-    # 1. Leg Straightness (Angle at knee)
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)
-
-    # 2. Leg Lift Height (Angle at hip, relative to torso/floor)
-    # The shoulder-hip-knee angle measures how far the leg is from the torso line (straight line = 180)
-    lift_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
+    knee_angle, lift_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_STRAIGHT_THRESHOLD = 170  # Min angle for straight legs (max 180)
@@ -48,18 +48,18 @@ def process_laying_leg_raises(image, landmarks, frame_width, frame_height, rep_c
 
     # At peak lift
     if lift_angle < LIFT_PEAK_THRESHOLD and knee_angle > KNEE_STRAIGHT_THRESHOLD:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Pause! Lower slowly with control."
 
     # At bottom (repetition complete)
-    elif lift_angle > LOWER_FLOOR_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif lift_angle > LOWER_FLOOR_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Raise again."
 
     # In between, not low/high enough
-    elif exercise_state == "down" and lift_angle < LOWER_FLOOR_THRESHOLD and lift_angle > LIFT_PEAK_THRESHOLD:
+    elif exercise_state == STATE_DOWN and lift_angle < LOWER_FLOOR_THRESHOLD and lift_angle > LIFT_PEAK_THRESHOLD:
         if "Straighten" not in feedback_text:
             feedback_text = "Raise higher or lower slower!"
         leg_line_color = BAD_COLOR
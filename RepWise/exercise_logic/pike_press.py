@@ -1,28 +1,28 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, LEFT_KNEE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),  # Press depth
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Maintains the pike shape (hips high)
+)
 
-def process_pike_press(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_pike_press(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for the Bodyweight Pike Press.
     Checks elbow angle for depth and hip angle for maintaining the pike position.
     Assumes a side view.
     """
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_hip_2d = lm2[LEFT_HIP]
 
     # Calculate angles
-    elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d) # Press depth
-    pike_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d) # Maintains the pike shape (hips high)
+    elbow_angle, pike_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     ELBOW_PRESS_THRESHOLD = 90  # Max bend at the bottom of the press
@@ -46,25 +46,25 @@ def process_pike_press(image, landmarks, frame_width, frame_height, rep_counter,
 
     # At bottom (Press depth reached)
     if elbow_angle < ELBOW_PRESS_THRESHOLD and pike_angle < PIKE_SHAPE_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Drive up through your hands!"
 
     # At top (Lockout)
-    elif elbow_angle > ELBOW_LOCKOUT_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif elbow_angle > ELBOW_LOCKOUT_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Lower head slowly."
 
     # Standing, waiting (holding lockout)
-    elif exercise_state == "up" and elbow_angle > ELBOW_LOCKOUT_THRESHOLD:
+    elif exercise_state == STATE_UP and elbow_angle > ELBOW_LOCKOUT_THRESHOLD:
         if "Hips higher" not in feedback_text:
             feedback_text = "Lower to the floor."
 
     # --- Draw Visual Cues ---
     # Draw arm line
     cv2.line(image, left_shoulder_2d, left_elbow_2d, arm_line_color, 4)
-    cv2.line(image, left_elbow_2d, get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height), arm_line_color, 4)
+    cv2.line(image, left_elbow_2d, lm2[LEFT_WRIST], arm_line_color, 4)
 
     # Draw pike line (hip to shoulder)
     cv2.line(image, left_hip_2d, left_shoulder_2d, pike_line_color, 4)
@@ -1,22 +1,24 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
+from utils import calculate_angle, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
     TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST
+from utils import STATE_UP, STATE_DOWN
 
 
-def process_pull_up(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_pull_up(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Pull Up.
     Checks elbow angle for rep range.
     """
 
     # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_elbow_3d = lm[LEFT_ELBOW, :3]
+    left_wrist_3d = lm[LEFT_WRIST, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_wrist_2d = get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_wrist_2d = lm2[LEFT_WRIST]
 
     # Calculate angles
     elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d)
@@ -32,22 +34,22 @@ def process_pull_up(image, landmarks, frame_width, frame_height, rep_counter, ex
 
     # At top of pull
     if elbow_angle < ELBOW_TOP_THRESHOLD:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Good pull! Lower down."
 
     # At bottom (dead hang)
-    elif elbow_angle > ELBOW_HANG_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif elbow_angle > ELBOW_HANG_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete!"
 
     # At bottom, waiting
-    elif exercise_state == "down" and elbow_angle > ELBOW_HANG_THRESHOLD:
+    elif exercise_state == STATE_DOWN and elbow_angle > ELBOW_HANG_THRESHOLD:
         feedback_text = "Pull up!"
 
     # In between (not high enough)
-    elif exercise_state == "down" and elbow_angle > ELBOW_TOP_THRESHOLD:
+    elif exercise_state == STATE_DOWN and elbow_angle > ELBOW_TOP_THRESHOLD:
         feedback_text = "Pull higher!"
         arm_line_color = BAD_COLOR
 
@@ -1,67 +1,60 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
+from utils import calculate_angles, angle_triples, COLORS, COLOR_GOOD, COLOR_BAD, mp_pose, BAD_COLOR, cv2, FONT, \
     TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, LEFT_KNEE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Simplified back angle
+)
 
-def process_pushup(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_pushup(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a pushup.
     Calculates angles, provides feedback, counts reps, and draws cues.
     """
 
-    # Get 3D coordinates for angle calculations
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-
     # Get 2D pixel coordinates for drawing
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_wrist_2d = get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_wrist_2d = lm2[LEFT_WRIST]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d)
-    back_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)  # Simplified back angle
+    elbow_angle, back_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Form Correction Cues & UI Coloring ---
-    elbow_line_color = GOOD_COLOR
-    back_line_color = GOOD_COLOR
-    hip_circle_color = GOOD_COLOR
+    # Color IDs index straight into COLORS (COLOR_GOOD = 0, COLOR_BAD = 1)
+    elbow_color_id = COLOR_GOOD
 
     # Back straightness
-    if back_angle < 160:  # Threshold for straight back
-        feedback_text = "Keep your back straight!"
-        back_line_color = BAD_COLOR
-        hip_circle_color = BAD_COLOR
-    else:
-        feedback_text = "Good back form!"
-        back_line_color = GOOD_COLOR
-        hip_circle_color = GOOD_COLOR
+    back_color_id = int(back_angle < 160)  # Threshold for straight back; 1 == COLOR_BAD
+    feedback_text = "Keep your back straight!" if back_color_id else "Good back form!"
 
     # Elbow depth (for rep counting)
     if elbow_angle < 90 and back_angle > 160:  # Deep enough and back is straight
-        exercise_state = "down"
-        elbow_line_color = GOOD_COLOR
+        exercise_state = STATE_DOWN
         feedback_text = "Lower!"
 
-    elif elbow_angle > 160 and exercise_state == "down":  # Back up, rep complete
-        exercise_state = "up"
+    elif elbow_angle > 160 and exercise_state == STATE_DOWN:  # Back up, rep complete
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete!"
-        elbow_line_color = GOOD_COLOR
 
-    elif elbow_angle > 160 and exercise_state == "up":  # Staying up, ready for next rep
+    elif elbow_angle > 160 and exercise_state == STATE_UP:  # Staying up, ready for next rep
         feedback_text = "Ready to lower!"
-        elbow_line_color = GOOD_COLOR
     else:
-        elbow_line_color = BAD_COLOR  # Indicate elbows aren't fully locked or deep enough
+        elbow_color_id = COLOR_BAD  # Indicate elbows aren't fully locked or deep enough
         if "back" not in feedback_text:  # Don't overwrite critical back feedback
             feedback_text = "Push up or lower!"
 
     # --- Draw Visual Cues ---
+    elbow_line_color = COLORS[elbow_color_id]
+    back_line_color = hip_circle_color = COLORS[back_color_id]
+
     # Elbow circle
     cv2.circle(image, left_elbow_2d, 10, elbow_line_color, -1)
 
@@ -73,7 +66,7 @@ def process_pushup(image, landmarks, frame_width, frame_height, rep_counter, exe
     cv2.circle(image, left_hip_2d, 10, hip_circle_color, -1)
 
     # Highlight bad back
-    if back_line_color == BAD_COLOR:
+    if back_color_id == COLOR_BAD:
         cv2.circle(image, left_hip_2d, 15, BAD_COLOR, -1)  # Larger red circle on hip
 
     # Display angles
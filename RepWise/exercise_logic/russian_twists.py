@@ -1,4 +1,6 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, RIGHT_SHOULDER, RIGHT_WRIST, LEFT_HIP, LEFT_KNEE
+from utils import STATE_UP, STATE_LEFT, STATE_RIGHT
 
 # Simple state variables to track the range of motion (rotation)
 ROTATION_LEFT_THRESHOLD = -0.15  # X-coordinate distance relative to hip center (negative is left)
@@ -6,30 +8,30 @@ ROTATION_RIGHT_THRESHOLD = 0.15  # X-coordinate distance relative to hip center
 BACK_FLAT_THRESHOLD = 120 # Angle between knee, hip, and shoulder (upright torso check)
 
 
-def process_russian_twist(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_russian_twist(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for the Bodyweight Russian Twist.
     Checks torso rotation (left/right) using shoulder X-coordinates relative to hip.
     Also checks for a flat back (upright torso).
     """
     # Get 3D coordinates (using right side landmarks for rotation check)
-    right_shoulder_3d = get_landmark_3d(landmarks, "RIGHT_SHOULDER")
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
+    right_shoulder_3d = lm[RIGHT_SHOULDER, :3]
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
 
     # Torso angle check (e.g., knee-hip-shoulder angle for leaning back)
     # Using hip angle (knee-hip-shoulder) to check if the user is leaning back correctly
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
+    left_hip_3d = lm[LEFT_HIP, :3]
+    left_knee_3d = lm[LEFT_KNEE, :3]
     back_angle = calculate_angle(left_knee_3d, left_hip_3d, left_shoulder_3d)
 
     # Relative X-position of the right wrist to the hip (proxy for rotation)
-    right_wrist_3d = get_landmark_3d(landmarks, "RIGHT_WRIST")
+    right_wrist_3d = lm[RIGHT_WRIST, :3]
     rotation_value = right_wrist_3d[0] - left_hip_3d[0]
 
     # Get 2D coordinates for drawing
-    right_shoulder_2d = get_landmark_coords(landmarks, "RIGHT_SHOULDER", frame_width, frame_height)
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    center_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
+    right_shoulder_2d = lm2[RIGHT_SHOULDER]
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    center_hip_2d = lm2[LEFT_HIP]
 
     # --- Form Correction ---
     back_line_color = GOOD_COLOR
@@ -46,24 +48,24 @@ def process_russian_twist(image, landmarks, frame_width, frame_height, rep_count
 
     # 1. At Left side (Contraction)
     if rotation_value < ROTATION_LEFT_THRESHOLD:
-        if exercise_state == "right":
-            exercise_state = "left"
+        if exercise_state == STATE_RIGHT:
+            exercise_state = STATE_LEFT
             feedback_text = "Twist to the right!"
 
     # 2. At Right side (Contraction)
     elif rotation_value > ROTATION_RIGHT_THRESHOLD:
-        if exercise_state == "left":
-            exercise_state = "right"
+        if exercise_state == STATE_LEFT:
+            exercise_state = STATE_RIGHT
             rep_counter += 1
             feedback_text = "Rep Complete! Twist back to the left."
 
     # 3. Center (Starting Position)
     elif ROTATION_LEFT_THRESHOLD <= rotation_value <= ROTATION_RIGHT_THRESHOLD:
-        if exercise_state == "up": # Use "up" as initial state before first rotation
+        if exercise_state == STATE_UP: # Use "up" as initial state before first rotation
             feedback_text = "Twist left to begin!"
-        elif exercise_state == "left":
+        elif exercise_state == STATE_LEFT:
             feedback_text = "Keep twisting right!"
-        elif exercise_state == "right":
+        elif exercise_state == STATE_RIGHT:
             feedback_text = "Keep twisting left!"
 
     # --- Draw Visual Cues ---
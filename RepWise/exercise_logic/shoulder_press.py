@@ -1,31 +1,31 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
+from utils import calculate_angles, angle_triples, mp_pose, GOOD_COLOR, BAD_COLOR, cv2, FONT, \
     TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, LEFT_KNEE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+    (LEFT_ELBOW, LEFT_SHOULDER, LEFT_HIP),  # Measures overhead
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Checks for lean
+)
 
-def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_shoulder_press(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Shoulder Press (Seated or Standing).
     Checks for back lean and rep range.
     """
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")  # For back angle
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_wrist_2d = get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_wrist_2d = lm2[LEFT_WRIST]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d)
-    shoulder_angle = calculate_angle(left_elbow_3d, left_shoulder_3d, left_hip_3d)  # Measures overhead
-    back_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)  # Checks for lean
+    elbow_angle, shoulder_angle, back_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     SHOULDER_OVERHEAD_THRESHOLD = 160  # Top of press
@@ -48,18 +48,18 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
 
     # At bottom (racked)
     if shoulder_angle < SHOULDER_RACK_THRESHOLD and back_angle > BACK_STRAIGHT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Press overhead!"
 
     # At top (overhead)
-    elif shoulder_angle > SHOULDER_OVERHEAD_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif shoulder_angle > SHOULDER_OVERHEAD_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete!"
 
     # At top, waiting
-    elif exercise_state == "up" and shoulder_angle > SHOULDER_OVERHEAD_THRESHOLD:
+    elif exercise_state == STATE_UP and shoulder_angle > SHOULDER_OVERHEAD_THRESHOLD:
         if "lean" not in feedback_text:
             feedback_text = "Lower to shoulders."
 
@@ -1,9 +1,12 @@
 import cv2
-import mediapipe as mp
+import numpy as np
 import json
 import time
+import queue
+import threading
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 
 # --- UPDATED IMPORTS ---
 from exercise_logic.pushup import process_pushup
@@ -32,37 +35,64 @@ from exercise_logic.single_leg_rdl import process_single_leg_rdl
 from exercise_logic.good_mornings import process_good_mornings
 
 # Import shared utilities
-from utils import mp_pose, GOOD_COLOR, BAD_COLOR, TEXT_COLOR
+from utils import mp_pose, GOOD_COLOR, BAD_COLOR, TEXT_COLOR, extract_landmarks, draw_pose_skeleton
+from utils import NOSE, LEFT_ANKLE, RIGHT_ANKLE
+from utils import STATE_UP
+
+# --- OpenCV Threading ---
+# The per-frame OpenCV work (color conversion, resize, small ROI blends) is too small for
+# a full thread pool: waking every core costs more than it saves. Two threads is plenty.
+cv2.setNumThreads(2)
 
 # --- Initialize MediaPipe Pose ---
-pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-mp_drawing = mp.solutions.drawing_utils
+# model_complexity=0 selects BlazePose Lite: about twice as fast as the default Full model,
+# and accurate enough for joint angles of a single person filling the frame.
+# The remaining options are the library defaults, spelled out so the video-mode tracker
+# (detector only runs when tracking is lost) and the unused segmentation mask stay pinned.
+pose = mp_pose.Pose(
+    static_image_mode=False,
+    model_complexity=0,
+    enable_segmentation=False,
+    smooth_landmarks=True,
+    min_detection_confidence=0.5,
+    min_tracking_confidence=0.5,
+)
+
+# Frames are shrunk to this width before pose.process. The pose models run on small
+# (~256 px) crops anyway and the landmarks come back normalized, so full-resolution
+# input only adds conversion and resize work.
+POSE_INPUT_WIDTH = 320
+
+# Live mode runs pose.process on every Nth frame only; the frames in between are shown
+# with the latest landmarks. Rep thresholds don't need 30 Hz updates.
+POSE_EVERY_N_FRAMES = 2
 
 # --- GLOBAL TTS State (Simulated) ---
-# In a real app, this would manage non-blocking audio output.
+# Speech runs on one long-lived worker thread so audio output never blocks the video feed.
+# The queue holds a single announcement; while the worker is busy, new ones are dropped.
 last_speech_time = time.time()
 SPEECH_COOLDOWN = 2.0  # Only allow speech every 2 seconds
+speech_queue = queue.Queue(maxsize=1)
 
 # Placeholder for API Key and URL (as per instructions)
 API_KEY = ""
 TTS_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-tts:generateContent?key={API_KEY}"
 
 
-def speak_feedback(text):
+def speech_worker():
     """
+    Speaks queued announcements one at a time (runs on a daemon thread for the app's lifetime).
     Simulates Text-to-Speech by printing to console.
-    This function limits speech to avoid rapid feedback.
     In a functional environment, this would call the Gemini TTS API.
     """
-    global last_speech_time
-    if time.time() - last_speech_time > SPEECH_COOLDOWN and text:
+    while True:
+        text = speech_queue.get()
         # Placeholder for actual API call and audio playback
         print(f"🔊 TTS Triggered: '{text}'")
-        last_speech_time = time.time()
 
         # --- TTS API CALL ARCHITECTURE (Simulated) ---
-        # NOTE: Using 'requests' in a synchronous loop like this will block the video feed.
-        # For real-time use, this would require non-blocking calls or threading.
+        # NOTE: This runs on the speech worker thread, so a blocking request here
+        # delays only the next announcement, never the video feed.
         # payload = {
         #     "contents": [{"parts": [{"text": text}]}],
         #     "generationConfig": {
@@ -80,6 +110,66 @@ def speak_feedback(text):
         # -----------------------------------------------
 
 
+def speak_feedback(text):
+    """
+    Hands feedback to the speech worker.
+    This function limits speech to avoid rapid feedback.
+    """
+    global last_speech_time
+    if time.time() - last_speech_time > SPEECH_COOLDOWN and text:
+        try:
+            speech_queue.put_nowait(text)
+        except queue.Full:
+            return  # Previous announcement not spoken yet
+        last_speech_time = time.time()
+
+
+threading.Thread(target=speech_worker, daemon=True).start()
+
+
+# Feedback keywords that mark a completed rep / a frame as good form
+GOOD_REP_KEYWORDS = ("good", "complete")
+GOOD_FRAME_KEYWORDS = ("good",)
+
+
+@lru_cache(maxsize=256)
+def classify_feedback(feedback_text):
+    """
+    Classifies a feedback string for WorkoutAnalyzer.log_frame.
+    Returns (back_issue, depth_issue, elbow_issue, form_issue_labels).
+    The same feedback repeats for many frames in a row, so each distinct string is only
+    lowercased and scanned once.
+    """
+    text = feedback_text.lower()
+    issues = []
+
+    back_issue = "back" in text and "straight" in text
+    if back_issue:
+        issues.append("Back not straight")
+    depth_issue = "depth" in text or "parallel" in text
+    if depth_issue:
+        issues.append("Insufficient depth")
+    elbow_issue = "elbow" in text or "tuck" in text
+    if elbow_issue:
+        issues.append("Elbow positioning")
+    if "lean" in text:
+        issues.append("Leaning back")
+    if "squat" in text and "don't" in text:
+        issues.append("Squatting instead of hinging")
+
+    return back_issue, depth_issue, elbow_issue, tuple(issues)
+
+
+@lru_cache(maxsize=512)
+def feedback_has_any(feedback_text, keywords):
+    """
+    True if the lowercased feedback contains any of the keywords (a tuple).
+    Used for the per-frame good-form checks; cached for the same reason as classify_feedback.
+    """
+    text = feedback_text.lower()
+    return any(keyword in text for keyword in keywords)
+
+
 class WorkoutAnalyzer:
     """Tracks workout metrics for analysis"""
 
@@ -110,19 +200,12 @@ class WorkoutAnalyzer:
             self.bad_form_frames += 1
 
         # Track specific issues
-        if "back" in feedback_text.lower() and "straight" in feedback_text.lower():
-            self.back_issues += 1
-            self.form_issues["Back not straight"] += 1
-        if "depth" in feedback_text.lower() or "parallel" in feedback_text.lower():
-            self.depth_issues += 1
-            self.form_issues["Insufficient depth"] += 1
-        if "elbow" in feedback_text.lower() or "tuck" in feedback_text.lower():
-            self.elbow_issues += 1
-            self.form_issues["Elbow positioning"] += 1
-        if "lean" in feedback_text.lower():
-            self.form_issues["Leaning back"] += 1
-        if "squat" in feedback_text.lower() and "don't" in feedback_text.lower():
-            self.form_issues["Squatting instead of hinging"] += 1
+        back_issue, depth_issue, elbow_issue, issues = classify_feedback(feedback_text)
+        self.back_issues += back_issue
+        self.depth_issues += depth_issue
+        self.elbow_issues += elbow_issue
+        for issue in issues:
+            self.form_issues[issue] += 1
 
     def log_rep(self, is_good_form=True):
         """Log a completed rep"""
@@ -225,6 +308,84 @@ def display_analysis_summary(summary):
     print("\n" + "=" * 60 + "\n")
 
 
+def to_pose_input(frame):
+    """
+    Prepares a BGR frame for pose.process: downscales it to POSE_INPUT_WIDTH (keeping the
+    aspect ratio) and converts it to a read-only RGB image.
+    """
+    frame_height, frame_width = frame.shape[:2]
+    if frame_width > POSE_INPUT_WIDTH:
+        small_height = round(frame_height * POSE_INPUT_WIDTH / frame_width)
+        frame = cv2.resize(frame, (POSE_INPUT_WIDTH, small_height), interpolation=cv2.INTER_AREA)
+    rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    rgb_image.flags.writeable = False
+    return rgb_image
+
+
+class PoseStream:
+    """
+    Runs webcam capture and MediaPipe inference on background threads.
+    The capture thread reads frames, the inference thread runs pose.process on every
+    POSE_EVERY_N_FRAMES-th one (reusing the last results in between), and
+    read() hands the newest (frame, results) pair to the UI loop. Both queues hold a single
+    item and drop the stale one, so a slow frame never makes the feed lag behind the camera.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.frames = queue.Queue(maxsize=1)
+        self.results = queue.Queue(maxsize=1)
+        self.stopped = threading.Event()
+        self.capture_thread = threading.Thread(target=self._capture, daemon=True)
+        self.inference_thread = threading.Thread(target=self._infer, daemon=True)
+
+    def start(self):
+        self.capture_thread.start()
+        self.inference_thread.start()
+        return self
+
+    @staticmethod
+    def _put_latest(q, item):
+        """Puts item on a single-slot queue, replacing anything the consumer has not taken yet."""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        q.put(item)
+
+    def _capture(self):
+        while not self.stopped.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                self.frames.put(None)  # Signal end of stream once the last frame is taken
+                return
+            self._put_latest(self.frames, frame)
+
+    def _infer(self):
+        frame_count = 0
+        results = None
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                self._put_latest(self.results, None)
+                return
+            # Skipped frames pass straight through with the previous results
+            if results is None or frame_count % POSE_EVERY_N_FRAMES == 0:
+                results = pose.process(to_pose_input(frame))
+            frame_count += 1
+            self._put_latest(self.results, (frame, results))
+
+    def read(self):
+        """Returns the newest (BGR frame, pose results) pair, or None once the camera stops."""
+        return self.results.get()
+
+    def stop(self):
+        self.stopped.set()
+        self.capture_thread.join()
+        self._put_latest(self.frames, None)  # Capture has stopped, so this is the only producer
+        self.inference_thread.join()
+
+
 # In main.py, replacing the existing run_live_mode function:
 
 def run_live_mode(exercise_name):
@@ -233,7 +394,7 @@ def run_live_mode(exercise_name):
     print("Press 'q' to quit\n")
 
     rep_counter = 0
-    exercise_state = "up"
+    exercise_state = STATE_UP
     feedback_text = ""
     analyzer = WorkoutAnalyzer()
 
@@ -241,6 +402,9 @@ def run_live_mode(exercise_name):
     if not cap.isOpened():
         print("Error: Could not open webcam.")
         return
+    # Keep only the newest frame in the driver (the default queue of ~4 frames adds latency);
+    # backends that don't support it ignore the call
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
     # Get exercise processor
     exercise_processor = get_exercise_processor(exercise_name)
@@ -248,20 +412,18 @@ def run_live_mode(exercise_name):
     # Dynamic Title implementation
     window_title = f'RepWise - Live Mode: {exercise_name.replace("_", " ").title()}'
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
+    # Capture and MediaPipe inference run in the background; this loop only processes and draws
+    stream = PoseStream(cap).start()
+
+    while True:
+        latest = stream.read()
+        if latest is None:
             print("Error: Could not read frame.")
             break
 
-        frame_height, frame_width, _ = frame.shape
-
-        # Process with MediaPipe
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        image.flags.writeable = False
-        results = pose.process(image)
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        # Draw straight onto the BGR frame the pose was detected in
+        image, results = latest
+        frame_height, frame_width, _ = image.shape
 
         # --- Pose Detection and Full Body Visibility Check ---
         is_visible = False
@@ -271,14 +433,14 @@ def run_live_mode(exercise_name):
         current_speech_text = ""
 
         if results.pose_landmarks:
-            landmarks = results.pose_landmarks.landmark
+            # Convert the landmarks into arrays once per frame
+            lm, lm2 = extract_landmarks(results.pose_landmarks.landmark, frame_width, frame_height)
 
             try:
                 # Check key landmarks (Nose, left ankle, right ankle) visibility > 0.5
-                vis_nose = landmarks[mp_pose.PoseLandmark.NOSE.value].visibility
-                vis_l_ankle = landmarks[mp_pose.PoseLandmark.LEFT_ANKLE.value].visibility
-                # FIX: Corrected typo from PoseLandland to PoseLandmark
-                vis_r_ankle = landmarks[mp_pose.PoseLandmark.RIGHT_ANKLE.value].visibility
+                vis_nose = lm[NOSE, 3]
+                vis_l_ankle = lm[LEFT_ANKLE, 3]
+                vis_r_ankle = lm[RIGHT_ANKLE, 3]
 
                 # Enforce minimum visibility for processing
                 if vis_nose > 0.5 and vis_l_ankle > 0.5 and vis_r_ankle > 0.5:
@@ -292,7 +454,7 @@ def run_live_mode(exercise_name):
                 prev_reps = rep_counter
 
                 processor_results = exercise_processor(
-                    image, landmarks, frame_width, frame_height,
+                    image, lm, lm2,
                     rep_counter, exercise_state, feedback_text
                 )
 
@@ -307,11 +469,11 @@ def run_live_mode(exercise_name):
 
                 # Track if rep was completed
                 if rep_counter > prev_reps:
-                    has_good_form = "good" in feedback_text.lower() or "complete" in feedback_text.lower()
+                    has_good_form = feedback_has_any(feedback_text, GOOD_REP_KEYWORDS)
                     analyzer.log_rep(has_good_form)
 
                 # Log frame
-                has_good_form = "good" in feedback_text.lower()
+                has_good_form = feedback_has_any(feedback_text, GOOD_FRAME_KEYWORDS)
                 analyzer.log_frame(feedback_text, has_good_form)
 
 
@@ -319,16 +481,12 @@ def run_live_mode(exercise_name):
                 current_frame_feedback = "Error processing pose data."
                 # print(f"Error in frame processing: {e}")
 
-            # Render skeleton
-            mp_drawing.draw_landmarks(
-                image, results.pose_landmarks, mp_pose.POSE_CONNECTIONS,
-                mp_drawing.DrawingSpec(color=(100, 100, 100), thickness=2, circle_radius=2),
-                mp_drawing.DrawingSpec(color=(150, 150, 150), thickness=2, circle_radius=2)
-            )
+            # Render skeleton from the landmark arrays extracted above
+            draw_pose_skeleton(image, lm, lm2)
 
         else:
             # If no pose detected or visibility is low, revert state (important for re-starting the rep logic)
-            exercise_state = "up"
+            exercise_state = STATE_UP
 
             # Draw a box over the screen to emphasize the no-tracking state
             cv2.rectangle(image, (0, 0), (frame_width, frame_height), BAD_COLOR, 10)
@@ -347,6 +505,7 @@ def run_live_mode(exercise_name):
         if cv2.waitKey(10) & 0xFF == ord('q'):
             break
 
+    stream.stop()
     cap.release()
     cv2.destroyAllWindows()
 
@@ -364,7 +523,7 @@ def analyze_recorded_video(video_path, exercise_name):
     print(f"Exercise: {exercise_name}\n")
 
     rep_counter = 0
-    exercise_state = "up"
+    exercise_state = STATE_UP
     feedback_text = ""
     analyzer = WorkoutAnalyzer()
 
@@ -394,20 +553,17 @@ def analyze_recorded_video(video_path, exercise_name):
 
         frame_height, frame_width, _ = frame.shape
 
-        # Process with MediaPipe
-        image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        image.flags.writeable = False
-        results = pose.process(image)
-        image.flags.writeable = True
-        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        # Process with MediaPipe (on a small RGB copy; the processors draw on the original BGR frame)
+        results = pose.process(to_pose_input(frame))
+        image = frame
 
         try:
-            landmarks = results.pose_landmarks.landmark
+            lm, lm2 = extract_landmarks(results.pose_landmarks.landmark, frame_width, frame_height)
             prev_reps = rep_counter
 
             # Process exercise-specific logic
             processor_results = exercise_processor(
-                image, landmarks, frame_width, frame_height,
+                image, lm, lm2,
                 rep_counter, exercise_state, feedback_text
             )
 
@@ -419,11 +575,11 @@ def analyze_recorded_video(video_path, exercise_name):
 
             # Track if rep was completed
             if rep_counter > prev_reps:
-                has_good_form = "good" in feedback_text.lower() or "complete" in feedback_text.lower()
+                has_good_form = feedback_has_any(feedback_text, GOOD_REP_KEYWORDS)
                 analyzer.log_rep(has_good_form)
 
             # Log frame
-            has_good_form = "good" in feedback_text.lower()
+            has_good_form = feedback_has_any(feedback_text, GOOD_FRAME_KEYWORDS)
             analyzer.log_frame(feedback_text, has_good_form)
 
         except:
@@ -444,91 +600,160 @@ def analyze_recorded_video(video_path, exercise_name):
 
 # In main.py, replace the existing display_live_ui function with this:
 
+# Size of the top-left reps/state box in the live UI
+INFO_BOX_WIDTH = 280
+INFO_BOX_HEIGHT = 80
+
+
+def draw_translucent_box(image, top_left, bottom_right, alpha):
+    """Darkens a box of the image in place, like a black rectangle blended in at the given alpha."""
+    (x1, y1), (x2, y2) = top_left, bottom_right
+    # Only the box region is touched (no full-frame overlay copy or blend)
+    image[y1:y2, x1:x2] = cv2.convertScaleAbs(image[y1:y2, x1:x2], alpha=1 - alpha)
+
+
+@lru_cache(maxsize=256)
+def get_text_size(text, scale, thickness):
+    """
+    Returns the (width, height) of text rendered in FONT_HERSHEY_SIMPLEX.
+    The UI redraws the same title and feedback strings every frame, so each distinct
+    string is only measured once.
+    """
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
+
+
+@lru_cache(maxsize=64)
+def render_info_text(metric_text, state_text):
+    """
+    Renders the two lines of the top-left info box as white text on a black patch.
+    Reps and state only change on rep events, so the patch is rasterized once per
+    distinct (metric, state) pair and reused on every frame in between.
+    """
+    # Long states (e.g. RECOVERING) run past the box edge, so widen the patch to fit the text
+    text_width = max(get_text_size(metric_text, 1, 2)[0], get_text_size(state_text, 1, 2)[0])
+    patch = np.zeros((INFO_BOX_HEIGHT, max(INFO_BOX_WIDTH, text_width + 12), 3), dtype=np.uint8)
+    cv2.putText(patch, metric_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+    cv2.putText(patch, state_text, (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+    return patch
+
+
+def draw_info_text(image, top, metric_text, state_text):
+    """Overlays the cached info text onto the (already darkened) info box starting at row 'top'."""
+    patch = render_info_text(metric_text, state_text)
+    roi = image[top:top + patch.shape[0], :patch.shape[1]]
+    # White text over a dark box: a per-pixel max lays the glyphs over it in place
+    cv2.max(roi, patch[:roi.shape[0], :roi.shape[1]], dst=roi)
+
+
+# Horizontal margin around a cached text line, so anti-aliased glyph edges are not clipped
+TEXT_PATCH_PAD = 4
+
+
+@lru_cache(maxsize=128)
+def render_text_line(text, scale, thickness, height, baseline_y):
+    """
+    Renders one line of white text on a black patch 'height' rows tall, with the text
+    baseline at row 'baseline_y'. The title and feedback strings repeat for many frames,
+    so each one is rasterized once instead of going through putText every frame.
+    """
+    text_width = get_text_size(text, scale, thickness)[0]
+    patch = np.zeros((height, text_width + 2 * TEXT_PATCH_PAD, 3), dtype=np.uint8)
+    cv2.putText(patch, text, (TEXT_PATCH_PAD, baseline_y),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, TEXT_COLOR, thickness, cv2.LINE_AA)
+    return patch
+
+
+def draw_text_line(image, text, x, top, scale, thickness, height, baseline_y):
+    """Overlays a cached text line onto the (already darkened) box at row 'top', text starting at column 'x'."""
+    patch = render_text_line(text, scale, thickness, height, baseline_y)
+    left = x - TEXT_PATCH_PAD
+    # Clip to the frame: long feedback strings can be wider than the image
+    x1, x2 = max(left, 0), min(left + patch.shape[1], image.shape[1])
+    if x1 >= x2:
+        return
+    roi = image[top:top + height, x1:x2]
+    cv2.max(roi, patch[:roi.shape[0], x1 - left:x2 - left], dst=roi)
+
+
 def display_live_ui(image, rep_counter, exercise_state, feedback_text, frame_width, frame_height, exercise_name):
     """Display UI elements for live mode, including centered title."""
-    overlay = image.copy()
     alpha = 0.6
 
     # 1. Centered Exercise Title (Top)
     # ***CHANGE 2: Use the passed exercise_name, format it for display***
     title_text = exercise_name.replace("_", " ").upper()
-    title_color = TEXT_COLOR  # White for visibility
     title_scale = 1.2
     title_thickness = 2
     title_box_height = 50
 
     # Draw transparent black box for title
-    cv2.rectangle(overlay, (0, 0), (frame_width, title_box_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
+    draw_translucent_box(image, (0, 0), (frame_width, title_box_height), alpha)
 
     # Calculate text position to center it
-    title_size = cv2.getTextSize(title_text, cv2.FONT_HERSHEY_SIMPLEX, title_scale, title_thickness)[0]
+    title_size = get_text_size(title_text, title_scale, title_thickness)
     title_x = (frame_width - title_size[0]) // 2
     title_y = 35
 
-    cv2.putText(image, title_text, (title_x, title_y),
-                cv2.FONT_HERSHEY_SIMPLEX, title_scale, title_color, title_thickness, cv2.LINE_AA)
+    draw_text_line(image, title_text, title_x, 0, title_scale, title_thickness, title_box_height, title_y)
 
     # 2. Reps and State box (Top Left - below the title box)
     box_start_y = title_box_height
-    cv2.rectangle(overlay, (0, box_start_y), (280, box_start_y + 80), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
+    draw_translucent_box(image, (0, box_start_y), (INFO_BOX_WIDTH, box_start_y + INFO_BOX_HEIGHT), alpha)
 
-    cv2.putText(image, 'REPS: ' + str(rep_counter), (10, box_start_y + 30),
-                cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
     # STATE: shows current phase (up, down, recovering)
-    cv2.putText(image, 'STATE: ' + exercise_state.upper(), (10, box_start_y + 70),
-                cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+    draw_info_text(image, box_start_y, 'REPS: ' + str(rep_counter), 'STATE: ' + exercise_state.name)
 
     # 3. Main Feedback Text (Centered Horizontally at Bottom)
     text_scale = 1.0
     text_thickness = 2
 
     # Calculate size of the text
-    text_size = cv2.getTextSize(feedback_text, cv2.FONT_HERSHEY_SIMPLEX, text_scale, text_thickness)[0]
+    text_size = get_text_size(feedback_text, text_scale, text_thickness)
 
     # Calculate starting X position to center the text
     text_x = (frame_width - text_size[0]) // 2
-    text_y = frame_height - 30
-
-    cv2.rectangle(overlay, (0, frame_height - 70), (frame_width, frame_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
-
-    # Put the text
-    cv2.putText(image, feedback_text, (text_x, text_y),
-                cv2.FONT_HERSHEY_SIMPLEX, text_scale, TEXT_COLOR, text_thickness, cv2.LINE_AA)
-
+    feedback_box_height = 70
+    text_baseline_y = 40  # i.e. 30 px above the bottom edge
+
+    draw_translucent_box(image, (0, frame_height - feedback_box_height), (frame_width, frame_height), alpha)
+
+    draw_text_line(image, feedback_text, text_x, frame_height - feedback_box_height,
+                   text_scale, text_thickness, feedback_box_height, text_baseline_y)
+
+
+
+# Exercise name -> processor function, built once at import
+EXERCISE_PROCESSORS = {
+    "pushup": process_pushup,
+    "barbell_squat": process_barbell_squat,
+    "air_squat": process_air_squat,
+    "deadlift": process_deadlift,
+    "chest_press": process_chest_press,
+    "shoulder_press": process_shoulder_press,
+    "pull_up": process_pull_up,
+    # --- NEW PROCESSORS ---
+    "donkey_calf_raise": process_donkey_calf_raise,
+    "forward_lunge": process_lunge,
+    "jump_squat": process_jump_squat,
+    "bulgarian_split_squat": process_bulgarian_split_squat,
+    "crunches": process_crunches,
+    "laying_leg_raises": process_laying_leg_raises,
+    "russian_twist": process_russian_twist,
+    "side_plank_up_down": process_side_plank_up_down,
+    "elbow_side_plank": process_elbow_side_plank,
+    "pike_press": process_pike_press,
+    "overhead_squat": process_overhead_squat,
+    "chin_ups": process_chin_ups,
+    "glute_bridge": process_glute_bridge,
+    "kickbacks": process_kickbacks,
+    "single_leg_rdl": process_single_leg_rdl,
+    "good_mornings": process_good_mornings,
+}
 
 
 def get_exercise_processor(exercise_name):
     """Return the appropriate exercise processor function"""
-    processors = {
-        "pushup": process_pushup,
-        "barbell_squat": process_barbell_squat,
-        "air_squat": process_air_squat,
-        "deadlift": process_deadlift,
-        "chest_press": process_chest_press,
-        "shoulder_press": process_shoulder_press,
-        "pull_up": process_pull_up,
-        # --- NEW PROCESSORS ---
-        "donkey_calf_raise": process_donkey_calf_raise,
-        "forward_lunge": process_lunge,
-        "jump_squat": process_jump_squat,
-        "bulgarian_split_squat": process_bulgarian_split_squat,
-        "crunches": process_crunches,
-        "laying_leg_raises": process_laying_leg_raises,
-        "russian_twist": process_russian_twist,
-        "side_plank_up_down": process_side_plank_up_down,
-        "elbow_side_plank": process_elbow_side_plank,
-        "pike_press": process_pike_press,
-        "overhead_squat": process_overhead_squat,
-        "chin_ups": process_chin_ups,
-        "glute_bridge": process_glute_bridge,
-        "kickbacks": process_kickbacks,
-        "single_leg_rdl": process_single_leg_rdl,
-        "good_mornings": process_good_mornings,
-    }
-    return processors.get(exercise_name, process_pushup)
+    return EXERCISE_PROCESSORS.get(exercise_name, process_pushup)
 
 
 def main():
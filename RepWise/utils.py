@@ -1,10 +1,46 @@
 import mediapipe as mp
 import numpy as np
 import cv2
+import math
+from enum import IntEnum
+
+# Numba is optional: without it the angle kernels below run as plain NumPy
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # --- MediaPipe Initialization ---
 mp_pose = mp.solutions.pose
 
+# Landmark name -> row index in the per-frame landmark array (see extract_landmarks)
+LM_IDX = {landmark.name: landmark.value for landmark in mp_pose.PoseLandmark}
+
+# Integer row indices for the landmarks used by the exercise logic, so the per-frame
+# code indexes the landmark array directly instead of going through LM_IDX
+NOSE = LM_IDX["NOSE"]
+LEFT_EAR = LM_IDX["LEFT_EAR"]
+LEFT_SHOULDER = LM_IDX["LEFT_SHOULDER"]
+RIGHT_SHOULDER = LM_IDX["RIGHT_SHOULDER"]
+LEFT_ELBOW = LM_IDX["LEFT_ELBOW"]
+RIGHT_ELBOW = LM_IDX["RIGHT_ELBOW"]
+LEFT_WRIST = LM_IDX["LEFT_WRIST"]
+RIGHT_WRIST = LM_IDX["RIGHT_WRIST"]
+LEFT_HIP = LM_IDX["LEFT_HIP"]
+RIGHT_HIP = LM_IDX["RIGHT_HIP"]
+LEFT_KNEE = LM_IDX["LEFT_KNEE"]
+RIGHT_KNEE = LM_IDX["RIGHT_KNEE"]
+LEFT_ANKLE = LM_IDX["LEFT_ANKLE"]
+RIGHT_ANKLE = LM_IDX["RIGHT_ANKLE"]
+LEFT_FOOT_INDEX = LM_IDX["LEFT_FOOT_INDEX"]
+RIGHT_FOOT_INDEX = LM_IDX["RIGHT_FOOT_INDEX"]
+
 # --- OpenCV Font ---
 FONT = cv2.FONT_HERSHEY_SIMPLEX
 
@@ -14,53 +50,171 @@ BAD_COLOR = (0, 0, 255)  # Red
 TEXT_COLOR = (255, 255, 255)  # White
 OUTLINE_COLOR = (0, 0, 0)  # Black
 
+# Form-cue colors by ID: cue logic can carry a small int and resolve the BGR tuple
+# once, where it is drawn
+COLOR_GOOD, COLOR_BAD = 0, 1
+COLORS = (GOOD_COLOR, BAD_COLOR)
+
+
+class ExerciseState(IntEnum):
+    """States of the rep-counting state machine shared by the exercise processors."""
+    UP = 0
+    DOWN = 1
+    RECOVERING = 2
+    LEFT = 3
+    RIGHT = 4
+
+
+# Module-level aliases for the per-frame comparisons (skips the Enum attribute lookup)
+STATE_UP, STATE_DOWN, STATE_RECOVERING, STATE_LEFT, STATE_RIGHT = ExerciseState
+
 
 # --- Helper Functions ---
 
 def calculate_angle(a, b, c):
     """
     Calculates the angle between three 3D points.
-    a, b, c: Tuples or lists of (x, y, z) coordinates.
+    a, b, c: Landmark rows (lm[idx, :3]), tuples or lists of (x, y, z) coordinates.
     The angle is calculated at point 'b'.
     """
-    a = np.array(a)  # First point
-    b = np.array(b)  # Mid point (vertex)
-    c = np.array(c)  # End point
+    # Work on plain Python floats: scalar math beats NumPy dispatch on 3-vectors
+    a_x, a_y, a_z = a.tolist() if isinstance(a, np.ndarray) else a
+    b_x, b_y, b_z = b.tolist() if isinstance(b, np.ndarray) else b
+    c_x, c_y, c_z = c.tolist() if isinstance(c, np.ndarray) else c
 
     # Calculate vectors
-    ba = a - b
-    bc = c - b
+    ba_x, ba_y, ba_z = a_x - b_x, a_y - b_y, a_z - b_z
+    bc_x, bc_y, bc_z = c_x - b_x, c_y - b_y, c_z - b_z
 
     # Calculate dot product
-    dot_product = np.dot(ba, bc)
+    dot_product = ba_x * bc_x + ba_y * bc_y + ba_z * bc_z
 
-    # Calculate magnitudes
-    mag_ba = np.linalg.norm(ba)
-    mag_bc = np.linalg.norm(bc)
+    # Calculate magnitudes (math.hypot is much cheaper than np.linalg.norm on 3-vectors)
+    mag_ba = math.hypot(ba_x, ba_y, ba_z)
+    mag_bc = math.hypot(bc_x, bc_y, bc_z)
 
     # Calculate cosine of the angle
     # Add a small epsilon to avoid division by zero
     cosine_angle = dot_product / (mag_ba * mag_bc + 1e-6)
 
-    # Clip values to prevent arccos errors
-    cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
+    # Clip values to prevent acos errors (plain min/max, np.clip is slow on scalars)
+    cosine_angle = max(-1.0, min(1.0, cosine_angle))
 
     # Calculate angle in radians and convert to degrees
-    angle = np.arccos(cosine_angle)
-    return np.degrees(angle)
+    return math.degrees(math.acos(cosine_angle))
 
 
-def get_landmark_coords(landmarks, part_name, image_width, image_height):
+@njit(cache=True)
+def _calculate_angle_jit(a, b, c):
+    """
+    Compiled twin of calculate_angle, used in its place when Numba is installed.
+    Indexes the points directly (tolist/isinstance are not available in nopython mode).
     """
-    Retrieves the pixel coordinates (x, y) of a specific landmark.
+    ba_x, ba_y, ba_z = float(a[0]) - float(b[0]), float(a[1]) - float(b[1]), float(a[2]) - float(b[2])
+    bc_x, bc_y, bc_z = float(c[0]) - float(b[0]), float(c[1]) - float(b[1]), float(c[2]) - float(b[2])
+
+    dot_product = ba_x * bc_x + ba_y * bc_y + ba_z * bc_z
+    mag_ba = math.sqrt(ba_x * ba_x + ba_y * ba_y + ba_z * ba_z)
+    mag_bc = math.sqrt(bc_x * bc_x + bc_y * bc_y + bc_z * bc_z)
+
+    # Add a small epsilon to avoid division by zero
+    cosine_angle = dot_product / (mag_ba * mag_bc + 1e-6)
+
+    cosine_angle = max(-1.0, min(1.0, cosine_angle))
+    return math.degrees(math.acos(cosine_angle))
+
+
+# The compiled version beats the pure-Python one even with Numba's call overhead; without
+# Numba it would run on NumPy scalars (slower than the Python version), so keep that instead
+if HAVE_NUMBA:
+    calculate_angle = _calculate_angle_jit
+    # Compile now rather than on the first visible frame (see the warm-up below _angles_from_landmarks);
+    # lm[i, :3] rows of the float32 landmark array are what the processors pass in
+    _dummy_lm = np.zeros((33, 4), dtype=np.float32)
+    calculate_angle(_dummy_lm[0, :3], _dummy_lm[1, :3], _dummy_lm[2, :3])
+    del _dummy_lm
+
+
+def angle_triples(*triples):
     """
-    lm = landmarks[mp_pose.PoseLandmark[part_name].value]
-    return (int(lm.x * image_width), int(lm.y * image_height))
+    Packs (a, b, c) landmark index triples into the index array calculate_angles takes.
+    Processors build theirs once at import, so no index array is rebuilt per frame.
+    """
+    return np.array(triples, dtype=np.intp)
+
+
+def calculate_angles(lm, triples):
+    """
+    Calculates several angles from the landmark array in one call.
+    lm: per-frame landmark array from extract_landmarks.
+    triples: (N, 3) landmark index array from angle_triples; each angle is calculated at point 'b'.
+    Returns a list with one angle (in degrees) per triple, in the same order.
+    """
+    if HAVE_NUMBA:
+        return _angles_from_landmarks(lm, triples).tolist()
+    # Without Numba, plain scalar calls beat NumPy's per-call overhead on a handful of angles
+    return [calculate_angle(lm[a, :3], lm[b, :3], lm[c, :3]) for a, b, c in triples.tolist()]
+
+
+@njit(cache=True)
+def _angles_from_landmarks(lm, triples):
+    """
+    Numba core of calculate_angles: gathers the points and computes every angle in one
+    compiled loop, so no (N, 3, 3) point array is built per frame.
+    """
+    angles = np.empty(triples.shape[0])
+    for i in range(triples.shape[0]):
+        angles[i] = _calculate_angle_jit(lm[triples[i, 0]], lm[triples[i, 1]], lm[triples[i, 2]])
+    return angles
+
+
+# Numba compiles on the first call (seconds on a cold cache, and the on-disk cache is lost
+# whenever the source changes or the package directory is read-only). Compile at import
+# instead of on the first frame with a visible person, using a dummy landmark array of the
+# per-frame dtype and shape so calculate_angles hits the same signature later.
+if HAVE_NUMBA:
+    calculate_angles(np.zeros((33, 4), dtype=np.float32), angle_triples((0, 1, 2)))
+
+
+def extract_landmarks(landmarks, image_width, image_height):
+    """
+    Converts the MediaPipe landmark list into arrays, once per frame.
+    Returns (lm, lm2):
+      lm:  float32 array of shape (33, 4) holding (x, y, z, visibility) per landmark.
+           Use lm[LM_IDX[name], :3] for the 3D coordinates.
+      lm2: list of (x, y) pixel coordinates per landmark, ready for OpenCV drawing.
+    """
+    # Stream the values straight into one preallocated buffer (no per-landmark tuples)
+    lm = np.fromiter((v for p in landmarks for v in (p.x, p.y, p.z, p.visibility)),
+                     dtype=np.float32, count=4 * len(landmarks)).reshape(-1, 4)
+    lm2 = (lm[:, :2] * np.array([image_width, image_height], dtype=np.float32)).astype(np.int32).tolist()
+    return lm, lm2
+
+
+# --- Skeleton Drawing ---
+# MediaPipe's pose connections as plain (start, end) landmark index pairs, built once at import
+POSE_CONNECTIONS = tuple(sorted((int(start), int(end)) for start, end in mp_pose.POSE_CONNECTIONS))
 
 
-def get_landmark_3d(landmarks, part_name):
+def draw_pose_skeleton(image, lm, lm2, landmark_color=(100, 100, 100), connection_color=(150, 150, 150),
+                       thickness=2, circle_radius=2):
     """
-    Retrieves the 3D coordinates (x, y, z) of a specific landmark.
+    Draws the generic skeleton on the image from the per-frame arrays built by extract_landmarks.
+    This replaces mp_drawing.draw_landmarks, which rebuilds the same pixel coordinates from the
+    landmark protos that extract_landmarks has already computed. Same look: gray bones, then gray
+    joints with a white border, skipping landmarks with low visibility or outside the frame.
     """
-    lm = landmarks[mp_pose.PoseLandmark[part_name].value]
-    return [lm.x, lm.y, lm.z]
\ No newline at end of file
+    # Only draw landmarks that are visible and inside the frame (like draw_landmarks)
+    drawable = ((lm[:, 3] >= 0.5) & (lm[:, :2] >= 0).all(axis=1) & (lm[:, :2] <= 1).all(axis=1)).tolist()
+
+    # Draw lines (bones)
+    for start_idx, end_idx in POSE_CONNECTIONS:
+        if drawable[start_idx] and drawable[end_idx]:
+            cv2.line(image, lm2[start_idx], lm2[end_idx], connection_color, thickness)
+
+    # Draw circles (joints): white border first, then the fill
+    border_radius = max(circle_radius + 1, int(circle_radius * 1.2))
+    for index, point in enumerate(lm2):
+        if drawable[index]:
+            cv2.circle(image, point, border_radius, (255, 255, 255), thickness)
+            cv2.circle(image, point, circle_radius, landmark_color, thickness)
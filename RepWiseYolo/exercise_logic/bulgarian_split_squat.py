@@ -1,7 +1,17 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # Using the angle created by shoulder, hip, and front knee to check torso lean
+    (LEFT_SHOULDER, RIGHT_HIP, RIGHT_KNEE),
+    # Calculate front knee angle for depth
+    (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE),
+)
 
-def process_bulgarian_split_squat(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_bulgarian_split_squat(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Bulgarian Split Squat.
     Checks front knee depth and torso uprightness.
@@ -9,21 +19,12 @@ def process_bulgarian_split_squat(image, landmarks, frame_width, frame_height, r
     """
 
     # --- Front Leg (Working Leg) ---
-    front_knee_3d = get_landmark_3d(landmarks, "RIGHT_KNEE")
-    front_hip_3d = get_landmark_3d(landmarks, "RIGHT_HIP")
-    front_ankle_3d = get_landmark_3d(landmarks, "RIGHT_ANKLE")
-
-    front_knee_2d = get_landmark_coords(landmarks, "RIGHT_KNEE", frame_width, frame_height)
-    front_ankle_2d = get_landmark_coords(landmarks, "RIGHT_ANKLE", frame_width, frame_height)
-    front_hip_2d = get_landmark_coords(landmarks, "RIGHT_HIP", frame_width, frame_height)
+    front_knee_2d = lm2[RIGHT_KNEE]
+    front_ankle_2d = lm2[RIGHT_ANKLE]
+    front_hip_2d = lm2[RIGHT_HIP]
 
     # --- Torso/Rear Leg ---
-    shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    # Using the angle created by shoulder, hip, and front knee to check torso lean
-    torso_angle = calculate_angle(shoulder_3d, front_hip_3d, front_knee_3d)
-
-    # Calculate front knee angle for depth
-    front_knee_angle = calculate_angle(front_hip_3d, front_knee_3d, front_ankle_3d)
+    torso_angle, front_knee_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_DEPTH_THRESHOLD = 95  # Front knee angle at the bottom (near 90 degrees)
@@ -46,23 +47,23 @@ def process_bulgarian_split_squat(image, landmarks, frame_width, frame_height, r
 
     # At depth and torso is straight
     if front_knee_angle < KNEE_DEPTH_THRESHOLD and torso_angle > TORSO_UPRIGHT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Good depth! Drive up hard."
 
     # Standing up
-    elif front_knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif front_knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Lower slowly."
 
     # Standing, waiting
-    elif exercise_state == "up" and front_knee_angle > KNEE_STRAIGHT_THRESHOLD:
+    elif exercise_state == STATE_UP and front_knee_angle > KNEE_STRAIGHT_THRESHOLD:
         if "Torso" not in feedback_text:
             feedback_text = "Lower into the squat."
 
     # In between, not at depth
-    elif exercise_state == "up" and front_knee_angle < KNEE_STRAIGHT_THRESHOLD:
+    elif exercise_state == STATE_UP and front_knee_angle < KNEE_STRAIGHT_THRESHOLD:
         if "Torso" not in feedback_text:
             feedback_text = "Lower further! Hit parallel."
         front_knee_line_color = BAD_COLOR
@@ -74,7 +75,7 @@ def process_bulgarian_split_squat(image, landmarks, frame_width, frame_height, r
     cv2.circle(image, front_knee_2d, 10, front_knee_line_color, -1)
 
     # Torso line
-    cv2.line(image, front_hip_2d, get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height), torso_line_color, 4)
+    cv2.line(image, front_hip_2d, lm2[LEFT_HIP], torso_line_color, 4)
     cv2.circle(image, front_hip_2d, 10, torso_line_color, -1)
 
     # Display angles
@@ -1,24 +1,26 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_EAR, LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST
+from utils import STATE_UP, STATE_DOWN
 
 
-def process_chin_ups(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_chin_ups(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Chin Up.
     Checks elbow angle for rep range (chin above the bar).
     """
 
     # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_elbow_3d = lm[LEFT_ELBOW, :3]
+    left_wrist_3d = lm[LEFT_WRIST, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_wrist_2d = get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_wrist_2d = lm2[LEFT_WRIST]
 
     # Use nose/ear height relative to wrist to check chin over bar
-    left_ear_2d_y = get_landmark_coords(landmarks, "LEFT_EAR", frame_width, frame_height)[1]
+    left_ear_2d_y = lm2[LEFT_EAR][1]
     left_wrist_2d_y = left_wrist_2d[1]
 
     # Calculate angles
@@ -39,22 +41,22 @@ def process_chin_ups(image, landmarks, frame_width, frame_height, rep_counter, e
 
     # At top (chin up)
     if is_chin_up:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Good pull! Lower down slowly."
 
     # At bottom (dead hang)
-    elif elbow_angle > ELBOW_HANG_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif elbow_angle > ELBOW_HANG_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Pull up."
 
     # At bottom, waiting
-    elif exercise_state == "down" and elbow_angle > ELBOW_HANG_THRESHOLD:
+    elif exercise_state == STATE_DOWN and elbow_angle > ELBOW_HANG_THRESHOLD:
         feedback_text = "Pull up!"
 
     # In between (not high enough)
-    elif exercise_state == "down" and elbow_angle > ELBOW_TOP_THRESHOLD:
+    elif exercise_state == STATE_DOWN and elbow_angle > ELBOW_TOP_THRESHOLD:
         feedback_text = "Pull higher! Get your chin over the bar."
         arm_line_color = BAD_COLOR
 
@@ -1,7 +1,9 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_ANKLE
+from utils import STATE_UP
 
 
-def process_elbow_side_plank(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_elbow_side_plank(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for the Elbow Side Plank (Static Hold).
     Focuses on form correction (straight body line) and provides feedback.
@@ -10,14 +12,14 @@ def process_elbow_side_plank(image, landmarks, frame_width, frame_height, rep_co
     """
 
     # Get 3D coordinates (using left side as the support side)
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_hip_3d = lm[LEFT_HIP, :3]
+    left_ankle_3d = lm[LEFT_ANKLE, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_ankle_2d = lm2[LEFT_ANKLE]
 
     # Angle check for straight body line (shoulder-hip-ankle) - Should be close to 180 (straight)
     body_line_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_ankle_3d)
@@ -47,10 +49,10 @@ def process_elbow_side_plank(image, landmarks, frame_width, frame_height, rep_co
     # --- Rep Counting (Static Hold) ---
     # Since this is a static hold, we keep the rep counter unchanged.
     # The state machine remains in the initial state or a simplified "holding" state.
-    if exercise_state == "up":
+    if exercise_state == STATE_UP:
         pass
     else:
-        exercise_state = "up"
+        exercise_state = STATE_UP
 
 
     # --- Draw Visual Cues ---
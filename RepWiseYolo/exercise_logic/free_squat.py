@@ -1,7 +1,17 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN, STATE_RECOVERING
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # 1. Knee Angle (Hip-Knee-Ankle): Used for depth (90 degrees is parallel)
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+    # 2. Torso Angle (Shoulder-Hip-Knee): Used for back/torso lean (should stay relatively open)
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+)
 
-def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_air_squat(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Air Squats (Free Squats).
     Checks knee depth and back angle.
@@ -9,24 +19,14 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
     """
     speech_text = ""
 
-    # Get 3D coordinates (using LEFT side for angled view)
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-
     # Get 2D coordinates for drawing (using LEFT side)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
+    left_ankle_2d = lm2[LEFT_ANKLE]
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
 
     # Calculate angles
-    # 1. Knee Angle (Hip-Knee-Ankle): Used for depth (90 degrees is parallel)
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)
-
-    # 2. Torso Angle (Shoulder-Hip-Knee): Used for back/torso lean (should stay relatively open)
-    torso_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
+    knee_angle, torso_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_PARALLEL_THRESHOLD = 100  # Angle for achieving depth (more lenient than 95 for better tracking)
@@ -50,7 +50,7 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
     # 2. Rep Counting (State Machine: up -> down -> recovering -> up)
 
     # State 1: UP (Ready to start or Rep Complete)
-    if exercise_state == "up":
+    if exercise_state == STATE_UP:
         if knee_angle > KNEE_TOP_THRESHOLD:
             # Fully standing, ready to start
             if current_feedback == "":
@@ -60,7 +60,7 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
 
             # TRANSITION: UP -> DOWN (Start squatting)
             if knee_angle < KNEE_TOP_THRESHOLD - 5 and is_upright_torso:
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Hips back and down. Maintain a straight back."
                 speech_text = "Squat."
 
@@ -68,7 +68,7 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
             # Not fully locked out OR already squatting
             if knee_angle < KNEE_TOP_THRESHOLD - 5 and is_upright_torso:
                 # FIX: If we are already squatting but state is 'up', transition to 'down' to catch the rep.
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Hips back and down. Maintain a straight back."
                 speech_text = "Lower."
             else:
@@ -76,10 +76,10 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
                 knee_line_color = BAD_COLOR
 
     # State 2: DOWN (Rep in progress - focusing on achieving depth)
-    elif exercise_state == "down":
+    elif exercise_state == STATE_DOWN:
         if knee_angle < KNEE_PARALLEL_THRESHOLD:
             # REACHED DEPTH: Now transition to RECOVERING state
-            exercise_state = "recovering"
+            exercise_state = STATE_RECOVERING
             if current_feedback == "":
                 current_feedback = "Good depth! Drive up through your heels."
                 if speech_text == "":
@@ -93,11 +93,11 @@ def process_air_squat(image, landmarks, frame_width, frame_height, rep_counter,
                 knee_line_color = BAD_COLOR
 
     # State 3: RECOVERING (Coming up from the bottom)
-    elif exercise_state == "recovering":
+    elif exercise_state == STATE_RECOVERING:
         # Check for full lockout (Rep completion)
         if knee_angle > KNEE_TOP_THRESHOLD and is_upright_torso:
             # TRANSITION: RECOVERING -> UP (Rep Count)
-            exercise_state = "up"
+            exercise_state = STATE_UP
             rep_counter += 1
             current_feedback = "Rep Complete! Reset and squat again."
             speech_text = "Rep complete."
@@ -1,36 +1,36 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
+from collections import deque
+from itertools import islice
 
-# Simple history to track hip height for jump detection
-hip_height_history = []
+# Simple history to track hip height for jump detection (the deque drops the oldest entry itself)
 MAX_HISTORY_LEN = 5
+hip_height_history = deque(maxlen=MAX_HISTORY_LEN)
 
-def process_jump_squat(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),  # Depth check
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Back straightness
+)
+
+
+def process_jump_squat(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Jump Squat.
     Checks knee depth, back straightness, and uses vertical hip movement for jump detection.
     """
 
-    global hip_height_history
-
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-
     # Get 2D coordinates
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d) # Depth check
-    back_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d) # Back straightness
+    knee_angle, back_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # Track hip height (y-coord) for jump detection (lower y is higher up on screen)
     current_hip_y = left_hip_2d[1]
     hip_height_history.append(current_hip_y)
-    if len(hip_height_history) > MAX_HISTORY_LEN:
-        hip_height_history.pop(0)
 
     # --- Define Thresholds ---
     KNEE_DEPTH_THRESHOLD = 100  # Squat depth achieved (e.g., parallel)
@@ -42,7 +42,7 @@ def process_jump_squat(image, landmarks, frame_width, frame_height, rep_counter,
     if len(hip_height_history) == MAX_HISTORY_LEN:
         # Check if hip is moving upwards (y-coord decreasing) quickly
         # This simple check confirms the hip is higher than a few frames ago
-        if current_hip_y < min(hip_height_history[:-2]) and knee_angle > KNEE_JUMP_THRESHOLD:
+        if current_hip_y < min(islice(hip_height_history, MAX_HISTORY_LEN - 2)) and knee_angle > KNEE_JUMP_THRESHOLD:
             IS_JUMPING = True
 
     # --- Form Correction Cues & UI Coloring ---
@@ -57,24 +57,24 @@ def process_jump_squat(image, landmarks, frame_width, frame_height, rep_counter,
     # 2. Count Reps (State Machine)
 
     # LANDED/STANDING UP: Ready to start squat (reset state)
-    if knee_angle > KNEE_JUMP_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    if knee_angle > KNEE_JUMP_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Absorb and sink."
 
     # SQUATTING PHASE: Going down
     elif knee_angle < KNEE_DEPTH_THRESHOLD and back_angle > BACK_STRAIGHT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Drive up explosively!"
 
     # JUMP PHASE: In the air
-    elif IS_JUMPING and exercise_state == "down":
+    elif IS_JUMPING and exercise_state == STATE_DOWN:
         knee_line_color = GOOD_COLOR
         feedback_text = "EXPLODE!"
 
     # In between, not at depth
-    elif exercise_state == "up" and knee_angle > KNEE_DEPTH_THRESHOLD and knee_angle < KNEE_JUMP_THRESHOLD:
+    elif exercise_state == STATE_UP and knee_angle > KNEE_DEPTH_THRESHOLD and knee_angle < KNEE_JUMP_THRESHOLD:
         if "back" not in feedback_text:
             feedback_text = "SQUAT deeper!"
         knee_line_color = BAD_COLOR
@@ -82,7 +82,7 @@ def process_jump_squat(image, landmarks, frame_width, frame_height, rep_counter,
     # --- Draw Visual Cues ---
     # Draw skeleton lines (hip to knee, knee to ankle)
     cv2.line(image, left_hip_2d, left_knee_2d, knee_line_color, 4)
-    cv2.line(image, left_knee_2d, get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height), knee_line_color, 4)
+    cv2.line(image, left_knee_2d, lm2[LEFT_ANKLE], knee_line_color, 4)
     cv2.circle(image, left_knee_2d, 10, knee_line_color, -1)
     cv2.circle(image, left_hip_2d, 10, back_line_color, -1)
 
@@ -1,32 +1,32 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # 1. Kickback Angle (Shoulder-Hip-Knee) - Angle opens as leg raises behind
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    # 2. Knee Angle (Hip-Knee-Ankle) - Should be maintained near 90 degrees for bent-knee variation
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+)
 
-def process_kickbacks(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_kickbacks(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Glute Kickbacks (on all fours).
     Checks the kickback height (hip extension) on the moving leg (assumes LEFT).
     Requires side view.
     """
 
-    # Get 3D coordinates (using LEFT leg for movement)
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-
     # Get 2D coordinates
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
+    left_ankle_2d = lm2[LEFT_ANKLE]
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
 
 
     # Calculate angles
-    # 1. Kickback Angle (Shoulder-Hip-Knee) - Angle opens as leg raises behind
-    kickback_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
-
-    # 2. Knee Angle (Hip-Knee-Ankle) - Should be maintained near 90 degrees for bent-knee variation
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)
+    kickback_angle, knee_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KICK_MAX_THRESHOLD = 170 # Max extension (angle opens up)
@@ -48,18 +48,18 @@ def process_kickbacks(image, landmarks, frame_width, frame_height, rep_counter,
 
     # At top (max kick)
     if kickback_angle > KICK_MAX_THRESHOLD and KNEE_MIN_BEND < knee_angle < KNEE_MAX_BEND:
-        if exercise_state == "down":
-            exercise_state = "up"
+        if exercise_state == STATE_DOWN:
+            exercise_state = STATE_UP
             feedback_text = "Squeeze and hold! Lower slowly."
 
     # At bottom (starting position)
-    elif kickback_angle < KICK_START_THRESHOLD and exercise_state == "up":
-        exercise_state = "down"
+    elif kickback_angle < KICK_START_THRESHOLD and exercise_state == STATE_UP:
+        exercise_state = STATE_DOWN
         rep_counter += 1
         feedback_text = "Rep Complete! Kick back."
 
     # In between, not high enough
-    elif exercise_state == "down" and kickback_angle > KICK_START_THRESHOLD:
+    elif exercise_state == STATE_DOWN and kickback_angle > KICK_START_THRESHOLD:
         if "Maintain" not in feedback_text:
             feedback_text = "Kick higher and squeeze glutes."
         leg_line_color = BAD_COLOR
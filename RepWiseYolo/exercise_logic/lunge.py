@@ -1,29 +1,28 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, RIGHT_HIP, LEFT_KNEE, RIGHT_KNEE, RIGHT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE),  # Front knee depth
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Torso straightness
+)
 
-def process_lunge(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_lunge(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Forward Lunge.
     Checks knee depth and torso uprightness.
     """
 
-    # Using right side for the front leg (assumes side-on view, right leg leads)
-    front_knee_3d = get_landmark_3d(landmarks, "RIGHT_KNEE")
-    front_hip_3d = get_landmark_3d(landmarks, "RIGHT_HIP")
-    front_ankle_3d = get_landmark_3d(landmarks, "RIGHT_ANKLE")
-
-    rear_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    rear_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    rear_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-
     # Get 2D coordinates for drawing
-    front_knee_2d = get_landmark_coords(landmarks, "RIGHT_KNEE", frame_width, frame_height)
-    front_ankle_2d = get_landmark_coords(landmarks, "RIGHT_ANKLE", frame_width, frame_height)
-    rear_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)  # For torso drawing
+    front_knee_2d = lm2[RIGHT_KNEE]
+    front_ankle_2d = lm2[RIGHT_ANKLE]
+    rear_hip_2d = lm2[LEFT_HIP]  # For torso drawing
 
     # Calculate angles
-    front_knee_angle = calculate_angle(front_hip_3d, front_knee_3d, front_ankle_3d)  # Front knee depth
-    torso_angle = calculate_angle(rear_shoulder_3d, rear_hip_3d, rear_knee_3d)  # Torso straightness
+    # Using right side for the front leg (assumes side-on view, right leg leads)
+    front_knee_angle, torso_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_DEPTH_THRESHOLD = 95  # Front knee angle at the bottom (near 90 degrees)
@@ -46,23 +45,23 @@ def process_lunge(image, landmarks, frame_width, frame_height, rep_counter, exer
 
     # At depth and torso is straight
     if front_knee_angle < KNEE_DEPTH_THRESHOLD and torso_angle > TORSO_UPRIGHT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Good depth! Drive up."
 
     # Standing up
-    elif front_knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif front_knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Switch legs."
 
     # Standing, waiting
-    elif exercise_state == "up" and front_knee_angle > KNEE_STRAIGHT_THRESHOLD:
+    elif exercise_state == STATE_UP and front_knee_angle > KNEE_STRAIGHT_THRESHOLD:
         if "Torso" not in feedback_text:
             feedback_text = "Step forward and lower."
 
     # In between, not at depth
-    elif exercise_state == "up" and front_knee_angle < KNEE_STRAIGHT_THRESHOLD:
+    elif exercise_state == STATE_UP and front_knee_angle < KNEE_STRAIGHT_THRESHOLD:
         if "Torso" not in feedback_text:
             feedback_text = "Lower the back knee further."
         front_knee_line_color = BAD_COLOR
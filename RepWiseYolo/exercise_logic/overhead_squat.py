@@ -1,30 +1,29 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),  # Squat depth
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),  # Torso lean/back straightness
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),  # Arm straightness
+)
 
-def process_overhead_squat(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_overhead_squat(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for the Pole Overhead Squat.
     Checks knee depth, back straightness, and arm lockout/verticality.
     Assumes side view.
     """
 
-    # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d) # Squat depth
-    back_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d) # Torso lean/back straightness
-    arm_lockout_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d) # Arm straightness
+    knee_angle, back_angle, arm_lockout_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
     # --- Define Thresholds ---
     KNEE_DEPTH_THRESHOLD = 90  # Hips below parallel
@@ -54,18 +53,18 @@ def process_overhead_squat(image, landmarks, frame_width, frame_height, rep_coun
 
     # At depth, with good form
     if knee_angle < KNEE_DEPTH_THRESHOLD and back_angle > BACK_STRAIGHT_THRESHOLD and arm_lockout_angle > ARM_LOCKOUT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Good depth! Drive up."
 
     # Standing up from a squat
-    elif knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif knee_angle > KNEE_STRAIGHT_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete!"
 
     # In between, not at depth
-    elif exercise_state == "up" and knee_angle < KNEE_STRAIGHT_THRESHOLD and knee_angle > KNEE_DEPTH_THRESHOLD:
+    elif exercise_state == STATE_UP and knee_angle < KNEE_STRAIGHT_THRESHOLD and knee_angle > KNEE_DEPTH_THRESHOLD:
         if "Lock your elbows" not in feedback_text and "straight" not in feedback_text:
             feedback_text = "Lower deeper, keeping the pole overhead!"
         knee_line_color = BAD_COLOR
@@ -74,11 +73,11 @@ def process_overhead_squat(image, landmarks, frame_width, frame_height, rep_coun
     # Draw body lines
     cv2.line(image, left_shoulder_2d, left_hip_2d, back_line_color, 4)
     cv2.line(image, left_hip_2d, left_knee_2d, knee_line_color, 4)
-    cv2.line(image, left_knee_2d, get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height), knee_line_color, 4)
+    cv2.line(image, left_knee_2d, lm2[LEFT_ANKLE], knee_line_color, 4)
 
     # Draw arm lines
-    cv2.line(image, left_shoulder_2d, get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height), arm_line_color, 4)
-    cv2.line(image, get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height), get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height), arm_line_color, 4)
+    cv2.line(image, left_shoulder_2d, lm2[LEFT_ELBOW], arm_line_color, 4)
+    cv2.line(image, lm2[LEFT_ELBOW], lm2[LEFT_WRIST], arm_line_color, 4)
 
     # Draw circles
     cv2.circle(image, left_hip_2d, 10, back_line_color, -1)
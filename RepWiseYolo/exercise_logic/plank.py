@@ -1,12 +1,18 @@
 import time
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
 
 # Define a constant for the initial/stopped state time
 PLANK_STOPPED = 0.0
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+)
 
-def process_plank(image, landmarks, frame_width, frame_height, total_held_duration_base, plank_start_time,
-                  feedback_text):
+
+def process_plank(image, lm, lm2, total_held_duration_base, plank_start_time, feedback_text):
     """
     Processes the logic for the Plank hold.
     total_held_duration_base: Total time held BEFORE the current segment started (if running) or total accumulated time (if paused).
@@ -18,29 +24,20 @@ def process_plank(image, landmarks, frame_width, frame_height, total_held_durati
     current_time = time.time()
 
     # --- Check Pose Detectability ---
-    try:
-        # Check Left Hip (11) and Left Ankle (15) confidence
-        hip_conf = landmarks[11][2]
-        ankle_conf = landmarks[15][2]
-        is_form_detectable = hip_conf > 0.5 and ankle_conf > 0.5
-    except IndexError:
-        is_form_detectable = False
+    # Check Left Hip and Left Ankle confidence
+    hip_conf = lm[LEFT_HIP, 3]
+    ankle_conf = lm[LEFT_ANKLE, 3]
+    is_form_detectable = hip_conf > 0.5 and ankle_conf > 0.5
 
     # --- Get Coordinates and Angles ---
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-
     # 2D coordinates for drawing
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
-
-    hip_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
-    elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, get_landmark_3d(landmarks, "LEFT_WRIST"))
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_ankle_2d = lm2[LEFT_ANKLE]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_knee_2d = lm2[LEFT_KNEE]
+
+    hip_angle, elbow_angle = calculate_angles(lm, ANGLE_TRIPLES)
     is_elbow_plank = elbow_angle < 130
 
     STRAIGHT_BACK_MIN = 170
@@ -1,59 +1,70 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_ELBOW, RIGHT_ELBOW, LEFT_WRIST, RIGHT_WRIST
+from utils import STATE_UP, STATE_DOWN, STATE_RECOVERING
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    (LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST),
+    (RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST),
+)
 
-def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_shoulder_press(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for Shoulder Press (no weights).
     Checks the elbow extension and arm vertical position.
-    Works from front or side view.
-
-    IMPORTANT: This function expects 'landmarks' to be the YOLO keypoints array:
-    [[x1, y1, conf1], [x2, y2, conf2], ...] with 17 keypoints (COCO format)
+    Works from front or side view: in a side view only the visible arm is used.
 
-    It uses utils.py wrapper functions (get_landmark_3d, get_landmark_coords)
-    which internally map to YOLO_KEYPOINT_MAP indices.
+    IMPORTANT: This function expects 'lm'/'lm2' to be the per-frame arrays built by
+    utils.extract_landmarks from the YOLO keypoints (COCO format), indexed by the landmark constants.
     """
     # Initialize speech text for this frame
     speech_text = ""
 
     # Get 3D coordinates
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_elbow_3d = get_landmark_3d(landmarks, "LEFT_ELBOW")
-    left_wrist_3d = get_landmark_3d(landmarks, "LEFT_WRIST")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_wrist_3d = lm[LEFT_WRIST, :3]
 
-    right_shoulder_3d = get_landmark_3d(landmarks, "RIGHT_SHOULDER")
-    right_elbow_3d = get_landmark_3d(landmarks, "RIGHT_ELBOW")
-    right_wrist_3d = get_landmark_3d(landmarks, "RIGHT_WRIST")
-    right_hip_3d = get_landmark_3d(landmarks, "RIGHT_HIP")
+    right_shoulder_3d = lm[RIGHT_SHOULDER, :3]
+    right_wrist_3d = lm[RIGHT_WRIST, :3]
 
     # Get 2D coordinates for drawing
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_elbow_2d = get_landmark_coords(landmarks, "LEFT_ELBOW", frame_width, frame_height)
-    left_wrist_2d = get_landmark_coords(landmarks, "LEFT_WRIST", frame_width, frame_height)
-
-    right_shoulder_2d = get_landmark_coords(landmarks, "RIGHT_SHOULDER", frame_width, frame_height)
-    right_elbow_2d = get_landmark_coords(landmarks, "RIGHT_ELBOW", frame_width, frame_height)
-    right_wrist_2d = get_landmark_coords(landmarks, "RIGHT_WRIST", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_elbow_2d = lm2[LEFT_ELBOW]
+    left_wrist_2d = lm2[LEFT_WRIST]
+
+    right_shoulder_2d = lm2[RIGHT_SHOULDER]
+    right_elbow_2d = lm2[RIGHT_ELBOW]
+    right_wrist_2d = lm2[RIGHT_WRIST]
+
+    # --- Arm Visibility ---
+    # In a side view one arm is hidden; only use the arm(s) YOLO is confident about
+    VISIBILITY_THRESHOLD = 0.5
+    left_visible = lm[LEFT_ELBOW, 3] > VISIBILITY_THRESHOLD and lm[LEFT_WRIST, 3] > VISIBILITY_THRESHOLD
+    right_visible = lm[RIGHT_ELBOW, 3] > VISIBILITY_THRESHOLD and lm[RIGHT_WRIST, 3] > VISIBILITY_THRESHOLD
+    if not (left_visible or right_visible):
+        # Neither arm is clear: fall back to using both
+        left_visible = right_visible = True
 
     # Calculate angles
     # 1. Elbow Angle (Shoulder-Elbow-Wrist) - Should be ~180° when extended, <130° when lowered
-    left_elbow_angle = calculate_angle(left_shoulder_3d, left_elbow_3d, left_wrist_3d)
-    right_elbow_angle = calculate_angle(right_shoulder_3d, right_elbow_3d, right_wrist_3d)
+    # 2. Arm Vertical Position - Check if wrists are above shoulders (for proper press height)
+    # Y coordinate: lower value = higher position in image
+    if left_visible and right_visible:
+        left_elbow_angle, right_elbow_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
-    # Average both arms
-    elbow_angle = (left_elbow_angle + right_elbow_angle) / 2
+        # Average both arms
+        elbow_angle = (left_elbow_angle + right_elbow_angle) / 2
 
-    # 2. Arm Vertical Position - Check if wrists are above shoulders (for proper press height)
-    arm_raised = False
-    if left_shoulder_3d and left_wrist_3d:
-        # Y coordinate: lower value = higher position in image
         left_raised = left_wrist_3d[1] < left_shoulder_3d[1]
-        arm_raised = left_raised
-
-    if right_shoulder_3d and right_wrist_3d:
         right_raised = right_wrist_3d[1] < right_shoulder_3d[1]
-        arm_raised = arm_raised or right_raised
+        arm_raised = left_raised or right_raised
+    elif left_visible:
+        elbow_angle = left_elbow_angle = calculate_angle(left_shoulder_3d, lm[LEFT_ELBOW, :3], left_wrist_3d)
+        arm_raised = left_wrist_3d[1] < left_shoulder_3d[1]
+    else:
+        elbow_angle = right_elbow_angle = calculate_angle(right_shoulder_3d, lm[RIGHT_ELBOW, :3], right_wrist_3d)
+        arm_raised = right_wrist_3d[1] < right_shoulder_3d[1]
 
     # --- Define Thresholds ---
     ELBOW_EXTENDED_THRESHOLD = 140  # Arms extended overhead
@@ -65,8 +76,7 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
     is_lowered = elbow_angle < ELBOW_LOWERED_THRESHOLD
 
     # --- Form Correction Cues & UI Coloring ---
-    left_arm_color = GOOD_COLOR
-    right_arm_color = GOOD_COLOR
+    arm_color = GOOD_COLOR
 
     current_feedback = ""
 
@@ -74,18 +84,16 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
     if elbow_angle < 80 and not is_lowered:
         current_feedback = "Extend your arms more!"
         speech_text = "Extend arms."
-        left_arm_color = BAD_COLOR
-        right_arm_color = BAD_COLOR
+        arm_color = BAD_COLOR
     elif is_extended and not arm_raised:
         current_feedback = "Press your arms higher overhead!"
         speech_text = "Press higher."
-        left_arm_color = BAD_COLOR
-        right_arm_color = BAD_COLOR
+        arm_color = BAD_COLOR
 
     # 2. Rep Counting (State Machine)
 
     # State 1: UP (Arms extended overhead - Rep Complete)
-    if exercise_state == "up":
+    if exercise_state == STATE_UP:
         if is_extended:
             # Fully extended overhead, ready for next rep
             if current_feedback == "":
@@ -95,7 +103,7 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
 
             # TRANSITION: UP -> DOWN (Start Lowering)
             if elbow_angle < ELBOW_START_THRESHOLD:
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Lower your arms to shoulder level."
                 speech_text = "Lower."
 
@@ -103,20 +111,19 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
             # FIX: User has arms lowered but state is "up"
             if is_lowered:
                 # If we are already lowered, immediately transition to "down"
-                exercise_state = "down"
+                exercise_state = STATE_DOWN
                 current_feedback = "Continue lowering, then press up."
                 speech_text = "Lower."
             else:
                 # User is in between positions
                 current_feedback = "Press arms up overhead (Elbow: " + str(int(elbow_angle)) + ")"
-                left_arm_color = BAD_COLOR
-                right_arm_color = BAD_COLOR
+                arm_color = BAD_COLOR
 
     # State 2: DOWN (Arms lowered - preparing to press up)
-    elif exercise_state == "down":
+    elif exercise_state == STATE_DOWN:
         if is_lowered:
             # REACHED BOTTOM: Now transition to RECOVERING state
-            exercise_state = "recovering"
+            exercise_state = STATE_RECOVERING
             if current_feedback == "":
                 current_feedback = "Good! Now press up overhead."
                 if speech_text == "":
@@ -127,15 +134,14 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
                 current_feedback = "Lower your arms more to shoulder level."
                 if speech_text == "":
                     speech_text = "Lower."
-                left_arm_color = BAD_COLOR
-                right_arm_color = BAD_COLOR
+                arm_color = BAD_COLOR
 
     # State 3: RECOVERING (Pressing up from bottom)
-    elif exercise_state == "recovering":
+    elif exercise_state == STATE_RECOVERING:
         # Check for full extension (Rep completion)
         if is_extended:
             # TRANSITION: RECOVERING -> UP (Rep Count)
-            exercise_state = "up"
+            exercise_state = STATE_UP
             rep_counter += 1
             current_feedback = "Rep Complete! Lower for the next one."
             speech_text = "Rep complete."
@@ -152,35 +158,22 @@ def process_shoulder_press(image, landmarks, frame_width, frame_height, rep_coun
     feedback_text = current_feedback if current_feedback else feedback_text
 
     # --- Draw Visual Cues ---
-    # Draw left arm
-    if left_shoulder_2d and left_elbow_2d:
-        cv2.line(image, left_shoulder_2d, left_elbow_2d, left_arm_color, 4)
-    if left_elbow_2d and left_wrist_2d:
-        cv2.line(image, left_elbow_2d, left_wrist_2d, left_arm_color, 4)
-
-    # Draw right arm
-    if right_shoulder_2d and right_elbow_2d:
-        cv2.line(image, right_shoulder_2d, right_elbow_2d, right_arm_color, 4)
-    if right_elbow_2d and right_wrist_2d:
-        cv2.line(image, right_elbow_2d, right_wrist_2d, right_arm_color, 4)
-
-    # Draw circles on joints
-    if left_elbow_2d:
-        cv2.circle(image, left_elbow_2d, 10, left_arm_color, -1)
-    if right_elbow_2d:
-        cv2.circle(image, right_elbow_2d, 10, right_arm_color, -1)
-
-    if left_wrist_2d:
-        cv2.circle(image, left_wrist_2d, 10, left_arm_color, -1)
-    if right_wrist_2d:
-        cv2.circle(image, right_wrist_2d, 10, right_arm_color, -1)
-
-    # Display angles
-    if left_elbow_2d:
-        cv2.putText(image, f'L Elbow: {int(left_elbow_angle)}', (left_elbow_2d[0] + 15, left_elbow_2d[1]),
-                    FONT, 0.5, TEXT_COLOR, 1, cv2.LINE_AA)
-    if right_elbow_2d:
-        cv2.putText(image, f'R Elbow: {int(right_elbow_angle)}', (right_elbow_2d[0] + 15, right_elbow_2d[1]),
+    # Both arms share the same color and drawing, so draw each visible arm in one loop
+    arms = []
+    if left_visible:
+        arms.append(('L', left_elbow_angle, left_shoulder_2d, left_elbow_2d, left_wrist_2d))
+    if right_visible:
+        arms.append(('R', right_elbow_angle, right_shoulder_2d, right_elbow_2d, right_wrist_2d))
+
+    for _, _, shoulder_2d, elbow_2d, wrist_2d in arms:
+        cv2.line(image, shoulder_2d, elbow_2d, arm_color, 4)
+        cv2.line(image, elbow_2d, wrist_2d, arm_color, 4)
+        cv2.circle(image, elbow_2d, 10, arm_color, -1)
+        cv2.circle(image, wrist_2d, 10, arm_color, -1)
+
+    # Display angles (after all arms are drawn, so no line covers a label)
+    for side, side_elbow_angle, _, elbow_2d, _ in arms:
+        cv2.putText(image, f'{side} Elbow: {int(side_elbow_angle)}', (elbow_2d[0] + 15, elbow_2d[1]),
                     FONT, 0.5, TEXT_COLOR, 1, cv2.LINE_AA)
 
     return rep_counter, exercise_state, feedback_text, speech_text
\ No newline at end of file
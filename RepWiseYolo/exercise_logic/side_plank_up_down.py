@@ -1,7 +1,9 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
 
-def process_side_plank_up_down(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+def process_side_plank_up_down(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for the Side Plank Up Down (Hip Dips).
     Checks vertical hip position relative to the shoulder for range of motion.
@@ -9,14 +11,14 @@ def process_side_plank_up_down(image, landmarks, frame_width, frame_height, rep_
     """
 
     # Get 3D coordinates (using left side as the support side)
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
+    left_shoulder_3d = lm[LEFT_SHOULDER, :3]
+    left_hip_3d = lm[LEFT_HIP, :3]
+    left_ankle_3d = lm[LEFT_ANKLE, :3]
 
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_ankle_2d = get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_ankle_2d = lm2[LEFT_ANKLE]
 
     # Vertical position check
     # Hip Y-coordinate relative to the Shoulder Y-coordinate
@@ -46,18 +48,18 @@ def process_side_plank_up_down(image, landmarks, frame_width, frame_height, rep_
 
     # 1. At bottom (hip dipped)
     if hip_vertical_diff > HIP_BOTTOM_THRESHOLD and body_line_angle > BODY_STRAIGHT_THRESHOLD:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Lift hips to the ceiling!"
 
     # 2. At top (hips raised)
-    elif hip_vertical_diff < HIP_TOP_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif hip_vertical_diff < HIP_TOP_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Dip down slowly."
 
     # 3. In between, not high or low enough
-    elif exercise_state == "up" and HIP_TOP_THRESHOLD < hip_vertical_diff < HIP_BOTTOM_THRESHOLD:
+    elif exercise_state == STATE_UP and HIP_TOP_THRESHOLD < hip_vertical_diff < HIP_BOTTOM_THRESHOLD:
         feedback_text = "Lower hips for depth."
         line_color = BAD_COLOR
 
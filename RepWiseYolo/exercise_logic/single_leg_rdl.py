@@ -1,30 +1,30 @@
-from utils import get_landmark_3d, get_landmark_coords, calculate_angle, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import calculate_angles, angle_triples, GOOD_COLOR, BAD_COLOR, cv2, FONT, TEXT_COLOR
+from utils import LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE, LEFT_ANKLE
+from utils import STATE_UP, STATE_DOWN
 
+# (a, b, c) landmark triples for calculate_angles (angle at 'b'), built once at import
+ANGLE_TRIPLES = angle_triples(
+    # 1. Hinge Angle (Shoulder-Hip-Knee) - Torso/Leg angle. Smaller angle means more hinged.
+    (LEFT_SHOULDER, LEFT_HIP, LEFT_KNEE),
+    # 2. Knee Stability (Hip-Knee-Ankle) - Should maintain slight bend (not locked, not squatted)
+    (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE),
+)
 
-def process_single_leg_rdl(image, landmarks, frame_width, frame_height, rep_counter, exercise_state, feedback_text):
+
+def process_single_leg_rdl(image, lm, lm2, rep_counter, exercise_state, feedback_text):
     """
     Processes the logic for a Single Legged Romanian Deadlift (RDL).
     Checks the hip hinge depth and standing leg knee stability.
     Assumes side view, and the LEFT leg is the grounded (standing) leg.
     """
 
-    # Get 3D coordinates (Standing/Grounded Leg)
-    left_shoulder_3d = get_landmark_3d(landmarks, "LEFT_SHOULDER")
-    left_hip_3d = get_landmark_3d(landmarks, "LEFT_HIP")
-    left_knee_3d = get_landmark_3d(landmarks, "LEFT_KNEE")
-    left_ankle_3d = get_landmark_3d(landmarks, "LEFT_ANKLE")
-
     # Get 2D coordinates
-    left_shoulder_2d = get_landmark_coords(landmarks, "LEFT_SHOULDER", frame_width, frame_height)
-    left_hip_2d = get_landmark_coords(landmarks, "LEFT_HIP", frame_width, frame_height)
-    left_knee_2d = get_landmark_coords(landmarks, "LEFT_KNEE", frame_width, frame_height)
+    left_shoulder_2d = lm2[LEFT_SHOULDER]
+    left_hip_2d = lm2[LEFT_HIP]
+    left_knee_2d = lm2[LEFT_KNEE]
 
     # Calculate angles
-    # 1. Hinge Angle (Shoulder-Hip-Knee) - Torso/Leg angle. Smaller angle means more hinged.
-    hinge_angle = calculate_angle(left_shoulder_3d, left_hip_3d, left_knee_3d)
-
-    # 2. Knee Stability (Hip-Knee-Ankle) - Should maintain slight bend (not locked, not squatted)
-    knee_angle = calculate_angle(left_hip_3d, left_knee_3d, left_ankle_3d)
+    hinge_angle, knee_angle = calculate_angles(lm, ANGLE_TRIPLES)
 
 
     # --- Define Thresholds ---
@@ -52,18 +52,18 @@ def process_single_leg_rdl(image, landmarks, frame_width, frame_height, rep_coun
 
     # At bottom (Max hinge)
     if hinge_angle < HINGE_BOTTOM_THRESHOLD and KNEE_MAX_BEND < knee_angle < KNEE_MIN_BEND:
-        if exercise_state == "up":
-            exercise_state = "down"
+        if exercise_state == STATE_UP:
+            exercise_state = STATE_DOWN
             feedback_text = "Good stretch! Drive up using glutes."
 
     # Standing up (lockout)
-    elif hinge_angle > HINGE_TOP_THRESHOLD and exercise_state == "down":
-        exercise_state = "up"
+    elif hinge_angle > HINGE_TOP_THRESHOLD and exercise_state == STATE_DOWN:
+        exercise_state = STATE_UP
         rep_counter += 1
         feedback_text = "Rep Complete! Hinge slowly."
 
     # Standing, waiting
-    elif exercise_state == "up" and hinge_angle > HINGE_TOP_THRESHOLD:
+    elif exercise_state == STATE_UP and hinge_angle > HINGE_TOP_THRESHOLD:
         if "Don't squat" not in feedback_text and "Unlock your knee" not in feedback_text:
             feedback_text = "Hinge forward at the hips."
 
@@ -71,7 +71,7 @@ def process_single_leg_rdl(image, landmarks, frame_width, frame_height, rep_coun
     # Draw body lines
     cv2.line(image, left_shoulder_2d, left_hip_2d, hinge_line_color, 4)
     cv2.line(image, left_hip_2d, left_knee_2d, knee_line_color, 4)
-    cv2.line(image, left_knee_2d, get_landmark_coords(landmarks, "LEFT_ANKLE", frame_width, frame_height), knee_line_color, 4)
+    cv2.line(image, left_knee_2d, lm2[LEFT_ANKLE], knee_line_color, 4)
 
 
     # Draw circles on joints
@@ -0,0 +1,40 @@
+"""
+One-time export of the YOLOv8 pose checkpoint to a faster inference format.
+main.py picks the exported model up automatically when it sits next to the checkpoint.
+
+Usage: python export_model.py [onnx|engine|int8]
+  onnx   (default) ONNX model, runs on ONNX Runtime (CPU or CUDA)
+  engine TensorRT engine in fp16 (NVIDIA GPUs only)
+  int8   OpenVINO model quantized to int8, the fastest option on CPUs (VNNI / AMX)
+"""
+import sys
+
+from ultralytics import YOLO
+
+# Same checkpoint main.py falls back to (kept separate: importing main loads the model)
+YOLO_CHECKPOINT = "yolov8n-pose.pt"
+EXPORT_FORMATS = ("onnx", "engine", "int8")
+# Exports take a dynamic batch dimension: live mode feeds single frames, recorded-video
+# analysis batches of up to RECORDED_BATCH_SIZE (main.py) frames
+MAX_BATCH_SIZE = 8
+
+
+def export_model(export_format):
+    """Exports the checkpoint in the given format and returns the path of the exported model."""
+    model = YOLO(YOLO_CHECKPOINT)
+    if export_format == "int8":
+        # Post-training quantization; Ultralytics calibrates on its small COCO pose sample set
+        return model.export(format="openvino", imgsz=640, int8=True, dynamic=True)
+    # fp16 only pays off (and is only supported) on the GPU-backed TensorRT engine
+    return model.export(format=export_format, imgsz=640, half=(export_format == "engine"),
+                        dynamic=True, batch=MAX_BATCH_SIZE)
+
+
+if __name__ == "__main__":
+    export_format = sys.argv[1] if len(sys.argv) > 1 else "onnx"
+    if export_format not in EXPORT_FORMATS:
+        print(f"Unknown format '{export_format}'. Choose one of: {', '.join(EXPORT_FORMATS)}")
+        sys.exit(1)
+
+    exported_path = export_model(export_format)
+    print(f"✅ Exported {YOLO_CHECKPOINT} to {exported_path}")
@@ -1,9 +1,14 @@
 import cv2
+import numpy as np
 from ultralytics import YOLO
+import os
 import json
 import time
+import queue
+import threading
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 
 # --- UPDATED IMPORTS ---
 from exercise_logic.pushup import process_pushup
@@ -32,31 +37,206 @@ from exercise_logic.good_mornings import process_good_mornings
 from exercise_logic.plank import process_plank, PLANK_STOPPED, format_duration  # Import format_duration
 
 # Import shared utilities
-from utils import GOOD_COLOR, BAD_COLOR, TEXT_COLOR, draw_yolo_skeleton, YOLO_KEYPOINT_MAP
+from utils import GOOD_COLOR, BAD_COLOR, TEXT_COLOR, draw_yolo_skeleton, extract_landmarks
+from utils import NOSE, LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_WRIST, RIGHT_WRIST, LEFT_ANKLE, RIGHT_ANKLE
+from utils import STATE_UP, STATE_DOWN
+
+# --- OpenCV Threading ---
+# The per-frame OpenCV work (color conversion, resize, small ROI blends) is too small for
+# a full thread pool: waking every core costs more than it saves. Two threads is plenty.
+cv2.setNumThreads(2)
 
 # --- Initialize YOLO Pose Model ---
+# Exported copies of the checkpoint (see export_model.py) are used when present: they run
+# on ONNX Runtime / TensorRT without PyTorch's per-layer dispatch. Fastest first.
+YOLO_MODEL_PATHS = ("yolov8n-pose.engine", "yolov8n-pose_int8_openvino_model", "yolov8n-pose.onnx")
+YOLO_CHECKPOINT = "yolov8n-pose.pt"
+
 try:
-    yolo_model = YOLO("yolov8n-pose.pt")
-    print("✅ YOLOv8 Pose Model Loaded.")
+    yolo_model_path = next((path for path in YOLO_MODEL_PATHS if os.path.exists(path)), YOLO_CHECKPOINT)
+    yolo_model = YOLO(yolo_model_path, task="pose")
+    print(f"✅ YOLOv8 Pose Model Loaded ({yolo_model_path}).")
 except Exception as e:
     print(f"❌ Error loading YOLO model: {e}. Ensure 'ultralytics' is installed and 'yolov8n-pose.pt' is accessible.")
     yolo_model = None
 
+# Live mode runs YOLO on every Nth frame only; keypoints are carried across the frames in
+# between with sparse Lucas-Kanade optical flow (much cheaper than a model pass)
+YOLO_EVERY_N_FRAMES = 3
+LK_PARAMS = dict(winSize=(21, 21), maxLevel=2,
+                 criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03))
+
+# Recorded videos are analyzed offline, so frames go through YOLO in batches of this size
+# (one model call per batch keeps the GPU busy). Live mode stays at one frame for latency.
+RECORDED_BATCH_SIZE = 8
+
+
+class KeypointTracker:
+    """
+    Produces the first person's YOLO keypoints ([[x, y, conf], ...] in pixels) for every live
+    frame while only running the model on every YOLO_EVERY_N_FRAMES-th one.
+    In between, the last keypoints are moved with optical flow; keypoints the flow loses
+    get confidence 0, so the visibility checks treat them as not seen.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.frame_count = 0
+        self.prev_gray = None
+        self.keypoints = None
+        # Two grayscale frames are alive at once (this one and prev_gray), so conversions
+        # alternate between two preallocated buffers instead of allocating one per frame
+        self.gray_buffers = None
+
+    def update(self, image):
+        """Returns the keypoints for this frame, or None when nobody is detected."""
+        if self.gray_buffers is None or self.gray_buffers[0].shape != image.shape[:2]:
+            self.gray_buffers = (np.empty(image.shape[:2], dtype=np.uint8),
+                                 np.empty(image.shape[:2], dtype=np.uint8))
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self.gray_buffers[self.frame_count % 2])
+
+        if self.keypoints is None or self.frame_count % YOLO_EVERY_N_FRAMES == 0:
+            yolo_results = self.model(image, verbose=False)
+            if len(yolo_results[0].keypoints.data) > 0:
+                self.keypoints = yolo_results[0].keypoints.data[0].cpu().numpy()
+            else:
+                self.keypoints = None
+        else:
+            points = self.keypoints[:, :2].reshape(-1, 1, 2).astype(np.float32)
+            moved, status, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, points, None, **LK_PARAMS)
+            found = status.ravel() == 1
+
+            keypoints = self.keypoints.copy()
+            keypoints[found, :2] = moved.reshape(-1, 2)[found]
+            keypoints[~found, 2] = 0.0
+            self.keypoints = keypoints
+
+        self.prev_gray = gray
+        self.frame_count += 1
+        return self.keypoints
+
+
+class FrameReader:
+    """
+    Reads webcam frames on a background thread, so capture and decoding overlap with YOLO
+    inference and drawing on the main thread (which also keeps imshow/waitKey, as OpenCV's
+    GUI needs). The queue holds a single frame and drops the stale one, so the loop always
+    gets the newest frame instead of working through a backlog.
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.frames = queue.Queue(maxsize=1)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._capture, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _put_latest(self, item):
+        """Puts item on the single-slot queue, replacing the frame the main loop has not taken yet."""
+        try:
+            self.frames.get_nowait()
+        except queue.Empty:
+            pass
+        self.frames.put(item)
+
+    def _capture(self):
+        while not self.stopped.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                self._put_latest(None)  # Signal end of stream
+                return
+            self._put_latest(frame)
+
+    def read(self):
+        """Returns the newest BGR frame, or None once the camera stops."""
+        return self.frames.get()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
 # --- GLOBAL TTS State (Simulated) ---
+# Speech runs on one long-lived worker thread; while it is busy, new announcements are dropped
 last_speech_time = time.time()
 SPEECH_COOLDOWN = 2.0
+speech_queue = queue.Queue(maxsize=1)
 API_KEY = ""
 TTS_API_URL = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-preview-tts:generateContent?key={API_KEY}"
 
 
+def speech_worker():
+    """Simulates Text-to-Speech for queued announcements, one at a time (daemon thread)."""
+    while True:
+        text = speech_queue.get()
+        print(f"🔊 TTS Triggered: '{text}'")
+
+
 def speak_feedback(text):
-    """Simulates Text-to-Speech."""
+    """Hands feedback to the speech worker, rate-limited by SPEECH_COOLDOWN."""
     global last_speech_time
     if time.time() - last_speech_time > SPEECH_COOLDOWN and text:
-        print(f"🔊 TTS Triggered: '{text}'")
+        try:
+            speech_queue.put_nowait(text)
+        except queue.Full:
+            return  # Previous announcement not spoken yet
         last_speech_time = time.time()
 
 
+threading.Thread(target=speech_worker, daemon=True).start()
+
+
+# Feedback keywords that mark a completed rep / a frame as good form
+GOOD_REP_KEYWORDS = ("good", "complete")
+GOOD_FRAME_KEYWORDS = ("good", "perfect", "holding")
+LIVE_GOOD_FRAME_KEYWORDS = ("good", "perfect", "holding", "rep complete")
+# Plank feedback that counts toward held time in recorded videos
+PLANK_HOLD_KEYWORDS = ("perfect form", "holding")
+
+
+@lru_cache(maxsize=256)
+def classify_feedback(feedback_text):
+    """
+    Classifies a feedback string for WorkoutAnalyzer.log_frame.
+    Returns (back_issue, depth_issue, elbow_issue, form_issue_labels).
+    The same feedback repeats for many frames in a row, so each distinct string is only
+    lowercased and scanned once.
+    """
+    text = feedback_text.lower()
+    issues = []
+
+    back_issue = "back" in text and ("straight" in text or "flat" in text)
+    if back_issue:
+        issues.append("Back not straight")
+    if "hips up" in text or "hips down" in text:
+        issues.append("Hip Alignment Issue")
+    depth_issue = "depth" in text or "parallel" in text
+    if depth_issue:
+        issues.append("Insufficient depth")
+    elbow_issue = "elbow" in text or "tuck" in text
+    if elbow_issue:
+        issues.append("Elbow positioning")
+    if "lean" in text:
+        issues.append("Leaning back")
+    if "squat" in text and "don't" in text:
+        issues.append("Squatting instead of hinging")
+
+    return back_issue, depth_issue, elbow_issue, tuple(issues)
+
+
+@lru_cache(maxsize=512)
+def feedback_has_any(feedback_text, keywords):
+    """
+    True if the lowercased feedback contains any of the keywords (a tuple).
+    Used for the per-frame good-form checks; cached for the same reason as classify_feedback.
+    """
+    text = feedback_text.lower()
+    return any(keyword in text for keyword in keywords)
+
+
 class WorkoutAnalyzer:
     """Tracks workout metrics for analysis. Duration tracking added for time-based exercises."""
 
@@ -88,21 +268,13 @@ class WorkoutAnalyzer:
         else:
             self.bad_form_frames += 1
 
-        if "back" in feedback_text.lower() and ("straight" in feedback_text.lower() or "flat" in feedback_text.lower()):
-            self.back_issues += 1
-            self.form_issues["Back not straight"] += 1
-        if "hips up" in feedback_text.lower() or "hips down" in feedback_text.lower():
-            self.form_issues["Hip Alignment Issue"] += 1
-        if "depth" in feedback_text.lower() or "parallel" in feedback_text.lower():
-            self.depth_issues += 1
-            self.form_issues["Insufficient depth"] += 1
-        if "elbow" in feedback_text.lower() or "tuck" in feedback_text.lower():
-            self.elbow_issues += 1
-            self.form_issues["Elbow positioning"] += 1
-        if "lean" in feedback_text.lower():
-            self.form_issues["Leaning back"] += 1
-        if "squat" in feedback_text.lower() and "don't" in feedback_text.lower():
-            self.form_issues["Squatting instead of hinging"] += 1
+        # Track specific issues
+        back_issue, depth_issue, elbow_issue, issues = classify_feedback(feedback_text)
+        self.back_issues += back_issue
+        self.depth_issues += depth_issue
+        self.elbow_issues += elbow_issue
+        for issue in issues:
+            self.form_issues[issue] += 1
 
     def log_rep(self, is_good_form=True):
         """Log a completed rep (only used for rep-based exercises)"""
@@ -244,7 +416,7 @@ def run_live_mode(exercise_name):
     # For Plank: rep_or_duration = total accumulated time (float)
     # For Plank: plank_start_time = segment start timestamp (float) or PLANK_STOPPED (0.0)
     rep_or_duration = 0.0
-    exercise_state = "up"  # Default string state for rep-based exercises
+    exercise_state = STATE_UP  # Default state for rep-based exercises
     feedback_text = ""
     analyzer = WorkoutAnalyzer()
 
@@ -258,40 +430,43 @@ def run_live_mode(exercise_name):
     if not cap.isOpened():
         print("Error: Could not open webcam.")
         return
+    # Keep only the newest frame in the driver (the default queue of ~4 frames adds latency);
+    # backends that don't support it ignore the call
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
     exercise_processor = get_exercise_processor(exercise_name)
     window_title = f'RepWise - Live Mode: {exercise_name.replace("_", " ").title()}'
+    tracker = KeypointTracker(yolo_model)
+    reader = FrameReader(cap).start()
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
+    while True:
+        frame = reader.read()
+        if frame is None:
             print("Error: Could not read frame.")
             break
 
         frame_height, frame_width, _ = frame.shape
-        image = frame.copy()
+        image = frame  # cap.read() returns a fresh array every frame, so no copy is needed
 
-        # --- YOLO INFERENCE ---
-        yolo_results = yolo_model(image, verbose=False)
+        # --- YOLO INFERENCE (optical flow on the frames in between) ---
+        person_keypoints = tracker.update(image)
 
         is_visible = False
         landmarks = None
         current_frame_feedback = "CENTER AND SHOW ENTIRE BODY"
         current_speech_text = ""
 
-        if len(yolo_results[0].keypoints.data) > 0:
-            person_keypoints = yolo_results[0].keypoints.data[0].cpu().numpy()
-
+        if person_keypoints is not None:
             # --- POSE VISIBILITY CHECK ---
             try:
-                vis_nose = person_keypoints[YOLO_KEYPOINT_MAP["NOSE"]][2]
+                vis_nose = person_keypoints[NOSE][2]
 
                 if is_upper_body_exercise:
                     # Shoulder Press needs only torso and arms
-                    vis_l_shoulder = person_keypoints[YOLO_KEYPOINT_MAP["LEFT_SHOULDER"]][2]
-                    vis_r_shoulder = person_keypoints[YOLO_KEYPOINT_MAP["RIGHT_SHOULDER"]][2]
-                    vis_l_wrist = person_keypoints[YOLO_KEYPOINT_MAP["LEFT_WRIST"]][2]
-                    vis_r_wrist = person_keypoints[YOLO_KEYPOINT_MAP["RIGHT_WRIST"]][2]
+                    vis_l_shoulder = person_keypoints[LEFT_SHOULDER][2]
+                    vis_r_shoulder = person_keypoints[RIGHT_SHOULDER][2]
+                    vis_l_wrist = person_keypoints[LEFT_WRIST][2]
+                    vis_r_wrist = person_keypoints[RIGHT_WRIST][2]
 
                     if vis_nose > 0.5 and vis_l_shoulder > 0.5 and vis_r_shoulder > 0.5 and vis_l_wrist > 0.5 and vis_r_wrist > 0.5:
                         is_visible = True
@@ -299,8 +474,8 @@ def run_live_mode(exercise_name):
                     current_frame_feedback = "CENTER TORSO AND ARMS"
                 else:
                     # Full body exercises need anchors (ankles)
-                    vis_l_ankle = person_keypoints[YOLO_KEYPOINT_MAP["LEFT_ANKLE"]][2]
-                    vis_r_ankle = person_keypoints[YOLO_KEYPOINT_MAP["RIGHT_ANKLE"]][2]
+                    vis_l_ankle = person_keypoints[LEFT_ANKLE][2]
+                    vis_r_ankle = person_keypoints[RIGHT_ANKLE][2]
 
                     if vis_nose > 0.5 and vis_l_ankle > 0.5 and vis_r_ankle > 0.5:
                         is_visible = True
@@ -312,6 +487,9 @@ def run_live_mode(exercise_name):
                 is_visible = False
 
         if landmarks is not None and is_visible:
+            # Convert the keypoints into arrays once per frame (shared by the processor and skeleton)
+            lm, lm2 = extract_landmarks(landmarks, frame_width, frame_height)
+
             # --- PROCESS EXERCISE LOGIC ---
             try:
                 prev_reps_or_duration = rep_or_duration
@@ -321,7 +499,7 @@ def run_live_mode(exercise_name):
 
                     # Pass the accumulated duration (rep_or_duration) and segment start time
                     new_base_duration, plank_start_time, feedback_text, speech_text = exercise_processor(
-                        image, landmarks, frame_width, frame_height,
+                        image, lm, lm2,
                         rep_or_duration, plank_start_time, feedback_text
                     )
 
@@ -345,7 +523,7 @@ def run_live_mode(exercise_name):
                 # --- REP-BASED LOGIC ---
                 else:
                     processor_results = exercise_processor(
-                        image, landmarks, frame_width, frame_height,
+                        image, lm, lm2,
                         int(rep_or_duration), exercise_state, feedback_text
                     )
                     if len(processor_results) == 4:
@@ -355,7 +533,7 @@ def run_live_mode(exercise_name):
                         speech_text = ""
                     rep_or_duration = float(rep_or_duration)
 
-                    # NOTE: For rep-based, the state passed to UI is exercise_state (string)
+                    # NOTE: For rep-based, the state passed to UI is exercise_state (ExerciseState)
 
                 current_frame_feedback = feedback_text
                 current_speech_text = speech_text
@@ -363,11 +541,11 @@ def run_live_mode(exercise_name):
                 # --- LOGGING ---
                 if not is_time_based and rep_or_duration > prev_reps_or_duration:
                     # Log Rep for rep-based exercises
-                    has_good_form = "good" in feedback_text.lower() or "complete" in feedback_text.lower()
+                    has_good_form = feedback_has_any(feedback_text, GOOD_REP_KEYWORDS)
                     analyzer.log_rep(has_good_form)
 
                 # Log frame
-                has_good_form = "good" in feedback_text.lower() or "perfect" in feedback_text.lower() or "holding" in feedback_text.lower() or "rep complete" in feedback_text.lower()
+                has_good_form = feedback_has_any(feedback_text, LIVE_GOOD_FRAME_KEYWORDS)
                 analyzer.log_frame(feedback_text, has_good_form)
 
 
@@ -376,7 +554,7 @@ def run_live_mode(exercise_name):
                 print(f"Error in frame processing: {e}")
 
                 # Render skeleton using the custom YOLO drawing function
-            draw_yolo_skeleton(image, landmarks)
+            draw_yolo_skeleton(image, lm, lm2)
 
         else:
             # If no pose detected or visibility is low, revert state
@@ -389,7 +567,7 @@ def run_live_mode(exercise_name):
                 plank_start_time = PLANK_STOPPED  # Timer paused
                 current_frame_feedback = "POSE LOST: Find your plank position to resume timer."
             else:
-                exercise_state = "up"
+                exercise_state = STATE_UP
 
             # Draw a box over the screen to emphasize the no-tracking state
             cv2.rectangle(image, (0, 0), (frame_width, frame_height), BAD_COLOR, 10)
@@ -405,7 +583,7 @@ def run_live_mode(exercise_name):
 
         # --- CRITICAL FIX HERE ---
         # If it's time-based (Plank), we pass plank_start_time as the state (float).
-        # If it's rep-based, we pass the *string* exercise_state.
+        # If it's rep-based, we pass exercise_state (an ExerciseState).
         ui_state_arg = plank_start_time if is_time_based else exercise_state
 
         display_live_ui(image, rep_or_duration, ui_state_arg, current_frame_feedback, frame_width, frame_height,
@@ -416,6 +594,7 @@ def run_live_mode(exercise_name):
         if cv2.waitKey(10) & 0xFF == ord('q'):
             break
 
+    reader.stop()
     cap.release()
     cv2.destroyAllWindows()
 
@@ -425,6 +604,21 @@ def run_live_mode(exercise_name):
         analyzer.save_analysis(f"{exercise_name}_live_analysis.json")
 
 
+def read_frame_batches(cap, batch_size):
+    """Yields lists of up to batch_size consecutive frames from cap until the video ends."""
+    frames = []
+    while cap.isOpened():
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+        if len(frames) == batch_size:
+            yield frames
+            frames = []
+    if frames:
+        yield frames
+
+
 def analyze_recorded_video(video_path, exercise_name):
     """Analyze a recorded video and provide comprehensive summary."""
     global yolo_model
@@ -458,69 +652,68 @@ def analyze_recorded_video(video_path, exercise_name):
     exercise_processor = get_exercise_processor(exercise_name)
 
     frame_num = 0
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame_num += 1
-        if frame_num % 30 == 0:
-            print(f"Progress: {frame_num}/{total_frames} frames ({int(frame_num / total_frames * 100)}%)")
-
-        frame_height, frame_width, _ = frame.shape
-        image = frame.copy()
-
-        # Process with YOLO
-        yolo_results = yolo_model(image, verbose=False)
-        landmarks = None
-
-        if len(yolo_results[0].keypoints.data) > 0:
-            try:
-                landmarks = yolo_results[0].keypoints.data[0].cpu().numpy()
-            except IndexError:
-                pass
-
-        if landmarks is not None:
-            try:
-                prev_reps_or_duration = rep_or_duration
-
-                # For recorded video, we call the processor only for feedback/angles (not timing)
-                # We use fixed PLANK_STOPPED and 0.0 for time states to force form check logic
-                # We ignore the returned duration/start_time for recording analysis.
-                _, _, feedback_text, _ = exercise_processor(
-                    image, landmarks, frame_width, frame_height,
-                    0.0, PLANK_STOPPED, feedback_text
-                )
-
-                # Accumulate time only if form is good
-                if is_time_based:
-                    # Check for "Perfect form" or "HOLDING" to indicate good form
-                    if "perfect form" in feedback_text.lower() or "holding" in feedback_text.lower():
-                        rep_or_duration += frame_time_step
-
-                    analyzer.log_duration(rep_or_duration)
-                else:
-                    # REP-BASED (Normal logic)
-                    processor_results = exercise_processor(
-                        image, landmarks, frame_width, frame_height,
-                        int(rep_or_duration), "down", feedback_text  # Use fixed state for analysis
-                    )
-                    if len(processor_results) == 4:
-                        rep_or_duration, _, feedback_text, _ = processor_results
+    for frames in read_frame_batches(cap, RECORDED_BATCH_SIZE):
+        # Process the whole batch with YOLO in one call (Ultralytics accepts a list of frames)
+        batch_results = yolo_model(frames, verbose=False)
+
+        for frame, yolo_result in zip(frames, batch_results):
+            frame_num += 1
+            if frame_num % 30 == 0:
+                print(f"Progress: {frame_num}/{total_frames} frames ({int(frame_num / total_frames * 100)}%)")
+
+            frame_height, frame_width, _ = frame.shape
+            image = frame  # cap.read() returns a fresh array every frame, so no copy is needed
+
+            landmarks = None
+
+            if len(yolo_result.keypoints.data) > 0:
+                try:
+                    landmarks = yolo_result.keypoints.data[0].cpu().numpy()
+                except IndexError:
+                    pass
+
+            if landmarks is not None:
+                try:
+                    prev_reps_or_duration = rep_or_duration
+                    lm, lm2 = extract_landmarks(landmarks, frame_width, frame_height)
+
+                    if is_time_based:
+                        # For recorded video, we call the processor only for feedback/angles (not timing)
+                        # We use fixed PLANK_STOPPED and 0.0 for time states to force form check logic
+                        # We ignore the returned duration/start_time for recording analysis.
+                        _, _, feedback_text, _ = exercise_processor(
+                            image, lm, lm2,
+                            0.0, PLANK_STOPPED, feedback_text
+                        )
+
+                        # Accumulate time only if form is good
+                        # Check for "Perfect form" or "HOLDING" to indicate good form
+                        if feedback_has_any(feedback_text, PLANK_HOLD_KEYWORDS):
+                            rep_or_duration += frame_time_step
+
+                        analyzer.log_duration(rep_or_duration)
                     else:
-                        rep_or_duration, _, feedback_text = processor_results
-                    rep_or_duration = float(rep_or_duration)
-
-                    if rep_or_duration > prev_reps_or_duration:
-                        has_good_form = "good" in feedback_text.lower() or "complete" in feedback_text.lower()
-                        analyzer.log_rep(has_good_form)
-
-                # Log frame
-                has_good_form = "good" in feedback_text.lower() or "perfect" in feedback_text.lower() or "holding" in feedback_text.lower()
-                analyzer.log_frame(feedback_text, has_good_form)
-
-            except:
-                pass
+                        # REP-BASED (Normal logic)
+                        processor_results = exercise_processor(
+                            image, lm, lm2,
+                            int(rep_or_duration), STATE_DOWN, feedback_text  # Use fixed state for analysis
+                        )
+                        if len(processor_results) == 4:
+                            rep_or_duration, _, feedback_text, _ = processor_results
+                        else:
+                            rep_or_duration, _, feedback_text = processor_results
+                        rep_or_duration = float(rep_or_duration)
+
+                        if rep_or_duration > prev_reps_or_duration:
+                            has_good_form = feedback_has_any(feedback_text, GOOD_REP_KEYWORDS)
+                            analyzer.log_rep(has_good_form)
+
+                    # Log frame
+                    has_good_form = feedback_has_any(feedback_text, GOOD_FRAME_KEYWORDS)
+                    analyzer.log_frame(feedback_text, has_good_form)
+
+                except:
+                    pass
 
     cap.release()
 
@@ -534,32 +727,102 @@ def analyze_recorded_video(video_path, exercise_name):
         print("⚠ No valid data collected. Check video quality and framing.")
 
 
+# Size of the top-left reps/state box in the live UI
+INFO_BOX_WIDTH = 280
+INFO_BOX_HEIGHT = 80
+
+
+def draw_translucent_box(image, top_left, bottom_right, alpha):
+    """Darkens a box of the image in place, like a black rectangle blended in at the given alpha."""
+    (x1, y1), (x2, y2) = top_left, bottom_right
+    # Only the box region is touched (no full-frame overlay copy or blend)
+    image[y1:y2, x1:x2] = cv2.convertScaleAbs(image[y1:y2, x1:x2], alpha=1 - alpha)
+
+
+@lru_cache(maxsize=256)
+def get_text_size(text, scale, thickness):
+    """
+    Returns the (width, height) of text rendered in FONT_HERSHEY_SIMPLEX.
+    The UI redraws the same title and feedback strings every frame, so each distinct
+    string is only measured once.
+    """
+    return cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0]
+
+
+@lru_cache(maxsize=64)
+def render_info_text(metric_text, state_text):
+    """
+    Renders the two lines of the top-left info box as white text on a black patch.
+    Reps and state only change on rep events, so the patch is rasterized once per
+    distinct (metric, state) pair and reused on every frame in between.
+    """
+    # Long states (e.g. RECOVERING) run past the box edge, so widen the patch to fit the text
+    text_width = max(get_text_size(metric_text, 1, 2)[0], get_text_size(state_text, 1, 2)[0])
+    patch = np.zeros((INFO_BOX_HEIGHT, max(INFO_BOX_WIDTH, text_width + 12), 3), dtype=np.uint8)
+    cv2.putText(patch, metric_text, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+    cv2.putText(patch, state_text, (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+    return patch
+
+
+def draw_info_text(image, top, metric_text, state_text):
+    """Overlays the cached info text onto the (already darkened) info box starting at row 'top'."""
+    patch = render_info_text(metric_text, state_text)
+    roi = image[top:top + patch.shape[0], :patch.shape[1]]
+    # White text over a dark box: a per-pixel max lays the glyphs over it in place
+    cv2.max(roi, patch[:roi.shape[0], :roi.shape[1]], dst=roi)
+
+
+# Horizontal margin around a cached text line, so anti-aliased glyph edges are not clipped
+TEXT_PATCH_PAD = 4
+
+
+@lru_cache(maxsize=128)
+def render_text_line(text, scale, thickness, height, baseline_y):
+    """
+    Renders one line of white text on a black patch 'height' rows tall, with the text
+    baseline at row 'baseline_y'. The title and feedback strings repeat for many frames,
+    so each one is rasterized once instead of going through putText every frame.
+    """
+    text_width = get_text_size(text, scale, thickness)[0]
+    patch = np.zeros((height, text_width + 2 * TEXT_PATCH_PAD, 3), dtype=np.uint8)
+    cv2.putText(patch, text, (TEXT_PATCH_PAD, baseline_y),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, TEXT_COLOR, thickness, cv2.LINE_AA)
+    return patch
+
+
+def draw_text_line(image, text, x, top, scale, thickness, height, baseline_y):
+    """Overlays a cached text line onto the (already darkened) box at row 'top', text starting at column 'x'."""
+    patch = render_text_line(text, scale, thickness, height, baseline_y)
+    left = x - TEXT_PATCH_PAD
+    # Clip to the frame: long feedback strings can be wider than the image
+    x1, x2 = max(left, 0), min(left + patch.shape[1], image.shape[1])
+    if x1 >= x2:
+        return
+    roi = image[top:top + height, x1:x2]
+    cv2.max(roi, patch[:roi.shape[0], x1 - left:x2 - left], dst=roi)
+
+
 def display_live_ui(image, rep_or_duration, exercise_state, feedback_text, frame_width, frame_height, exercise_name):
     """Display UI elements for live mode, handling both reps and duration."""
-    overlay = image.copy()
     alpha = 0.6
 
     # 1. Centered Exercise Title (Top)
     title_text = exercise_name.replace("_", " ").upper()
-    title_color = TEXT_COLOR
     title_scale = 1.2
     title_thickness = 2
     title_box_height = 50
 
-    cv2.rectangle(overlay, (0, 0), (frame_width, title_box_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
+    draw_translucent_box(image, (0, 0), (frame_width, title_box_height), alpha)
 
-    title_size = cv2.getTextSize(title_text, cv2.FONT_HERSHEY_SIMPLEX, title_scale, title_thickness)[0]
+    title_size = get_text_size(title_text, title_scale, title_thickness)
     title_x = (frame_width - title_size[0]) // 2
     title_y = 35
 
-    cv2.putText(image, title_text, (title_x, title_y),
-                cv2.FONT_HERSHEY_SIMPLEX, title_scale, title_color, title_thickness, cv2.LINE_AA)
+    draw_text_line(image, title_text, title_x, 0, title_scale, title_thickness, title_box_height, title_y)
 
     # 2. Reps/Duration and State box (Top Left - below the title box)
     box_start_y = title_box_height
-    cv2.rectangle(overlay, (0, box_start_y), (280, box_start_y + 80), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
+    draw_translucent_box(image, (0, box_start_y), (INFO_BOX_WIDTH, box_start_y + INFO_BOX_HEIGHT), alpha)
 
     if exercise_name == "plank":
         # Display duration using the new millisecond format
@@ -573,55 +836,55 @@ def display_live_ui(image, rep_or_duration, exercise_state, feedback_text, frame
                     cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
 
     else:
-        # Rep-based display
-        cv2.putText(image, 'REPS: ' + str(int(rep_or_duration)), (10, box_start_y + 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
-        cv2.putText(image, 'STATE: ' + exercise_state.upper(), (10, box_start_y + 70),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1, TEXT_COLOR, 2, cv2.LINE_AA)
+        # Rep-based display (the timer above changes every frame, so only this text is cached)
+        draw_info_text(image, box_start_y, 'REPS: ' + str(int(rep_or_duration)), 'STATE: ' + exercise_state.name)
 
     # 3. Main Feedback Text (Centered Horizontally at Bottom)
     text_scale = 1.0
     text_thickness = 2
-    text_size = cv2.getTextSize(feedback_text, cv2.FONT_HERSHEY_SIMPLEX, text_scale, text_thickness)[0]
+    text_size = get_text_size(feedback_text, text_scale, text_thickness)
     text_x = (frame_width - text_size[0]) // 2
-    text_y = frame_height - 30
-
-    cv2.rectangle(overlay, (0, frame_height - 70), (frame_width, frame_height), (0, 0, 0), -1)
-    cv2.addWeighted(overlay, alpha, image, 1 - alpha, 0, image)
-
-    cv2.putText(image, feedback_text, (text_x, text_y),
-                cv2.FONT_HERSHEY_SIMPLEX, text_scale, TEXT_COLOR, text_thickness, cv2.LINE_AA)
+    feedback_box_height = 70
+    text_baseline_y = 40  # i.e. 30 px above the bottom edge
+
+    draw_translucent_box(image, (0, frame_height - feedback_box_height), (frame_width, frame_height), alpha)
+
+    draw_text_line(image, feedback_text, text_x, frame_height - feedback_box_height,
+                   text_scale, text_thickness, feedback_box_height, text_baseline_y)
+
+
+# Exercise name -> processor function, built once at import
+EXERCISE_PROCESSORS = {
+    "pushup": process_pushup,
+    "barbell_squat": process_barbell_squat,
+    "air_squat": process_air_squat,
+    "deadlift": process_deadlift,
+    "chest_press": process_chest_press,
+    "shoulder_press": process_shoulder_press,
+    "pull_up": process_pull_up,
+    "donkey_calf_raise": process_donkey_calf_raise,
+    "forward_lunge": process_lunge,
+    "jump_squat": process_jump_squat,
+    "bulgarian_split_squat": process_bulgarian_split_squat,
+    "crunches": process_crunches,
+    "laying_leg_raises": process_laying_leg_raises,
+    "russian_twist": process_russian_twist,
+    "side_plank_up_down": process_side_plank_up_down,
+    "elbow_side_plank": process_elbow_side_plank,
+    "pike_press": process_pike_press,
+    "overhead_squat": process_overhead_squat,
+    "chin_ups": process_chin_ups,
+    "glute_bridge": process_glute_bridge,
+    "kickbacks": process_kickbacks,
+    "single_leg_rdl": process_single_leg_rdl,
+    "good_mornings": process_good_mornings,
+    "plank": process_plank,
+}
 
 
 def get_exercise_processor(exercise_name):
     """Return the appropriate exercise processor function"""
-    processors = {
-        "pushup": process_pushup,
-        "barbell_squat": process_barbell_squat,
-        "air_squat": process_air_squat,
-        "deadlift": process_deadlift,
-        "chest_press": process_chest_press,
-        "shoulder_press": process_shoulder_press,
-        "pull_up": process_pull_up,
-        "donkey_calf_raise": process_donkey_calf_raise,
-        "forward_lunge": process_lunge,
-        "jump_squat": process_jump_squat,
-        "bulgarian_split_squat": process_bulgarian_split_squat,
-        "crunches": process_crunches,
-        "laying_leg_raises": process_laying_leg_raises,
-        "russian_twist": process_russian_twist,
-        "side_plank_up_down": process_side_plank_up_down,
-        "elbow_side_plank": process_elbow_side_plank,
-        "pike_press": process_pike_press,
-        "overhead_squat": process_overhead_squat,
-        "chin_ups": process_chin_ups,
-        "glute_bridge": process_glute_bridge,
-        "kickbacks": process_kickbacks,
-        "single_leg_rdl": process_single_leg_rdl,
-        "good_mornings": process_good_mornings,
-        "plank": process_plank,
-    }
-    return processors.get(exercise_name, process_pushup)
+    return EXERCISE_PROCESSORS.get(exercise_name, process_pushup)
 
 
 def main():
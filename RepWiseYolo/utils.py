@@ -3,6 +3,19 @@
 import numpy as np
 import cv2
 import math
+from enum import IntEnum
+
+# Numba is optional: without it the angle kernels below run as plain NumPy
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # MediaPipe imports removed
 
@@ -16,6 +29,32 @@ YOLO_KEYPOINT_MAP = {
     "LEFT_EYE": 1, "RIGHT_EYE": 2, "LEFT_EAR": 3, "RIGHT_EAR": 4,  # Added for visibility check robustness
 }
 
+# Row of the per-frame landmark array that is always zero (see extract_landmarks).
+# Names COCO has no keypoint for resolve to it, like the old (0, 0, 0) fallback.
+MISSING_KEYPOINT = 17
+
+# Landmark name -> row index in the per-frame landmark array
+LM_IDX = {**YOLO_KEYPOINT_MAP, "LEFT_FOOT_INDEX": MISSING_KEYPOINT, "RIGHT_FOOT_INDEX": MISSING_KEYPOINT}
+
+# Integer row indices for the landmarks used by the exercise logic, so the per-frame
+# code indexes the landmark array directly instead of going through LM_IDX
+NOSE = LM_IDX["NOSE"]
+LEFT_EAR = LM_IDX["LEFT_EAR"]
+LEFT_SHOULDER = LM_IDX["LEFT_SHOULDER"]
+RIGHT_SHOULDER = LM_IDX["RIGHT_SHOULDER"]
+LEFT_ELBOW = LM_IDX["LEFT_ELBOW"]
+RIGHT_ELBOW = LM_IDX["RIGHT_ELBOW"]
+LEFT_WRIST = LM_IDX["LEFT_WRIST"]
+RIGHT_WRIST = LM_IDX["RIGHT_WRIST"]
+LEFT_HIP = LM_IDX["LEFT_HIP"]
+RIGHT_HIP = LM_IDX["RIGHT_HIP"]
+LEFT_KNEE = LM_IDX["LEFT_KNEE"]
+RIGHT_KNEE = LM_IDX["RIGHT_KNEE"]
+LEFT_ANKLE = LM_IDX["LEFT_ANKLE"]
+RIGHT_ANKLE = LM_IDX["RIGHT_ANKLE"]
+LEFT_FOOT_INDEX = LM_IDX["LEFT_FOOT_INDEX"]
+RIGHT_FOOT_INDEX = LM_IDX["RIGHT_FOOT_INDEX"]
+
 # --- OpenCV Font ---
 FONT = cv2.FONT_HERSHEY_SIMPLEX
 
@@ -25,120 +64,184 @@ BAD_COLOR = (0, 0, 255)  # Red
 TEXT_COLOR = (255, 255, 255)  # White
 OUTLINE_COLOR = (0, 0, 0)  # Black
 
+# Form-cue colors by ID: cue logic can carry a small int and resolve the BGR tuple
+# once, where it is drawn
+COLOR_GOOD, COLOR_BAD = 0, 1
+COLORS = (GOOD_COLOR, BAD_COLOR)
+
+
+class ExerciseState(IntEnum):
+    """States of the rep-counting state machine shared by the exercise processors."""
+    UP = 0
+    DOWN = 1
+    RECOVERING = 2
+    LEFT = 3
+    RIGHT = 4
+
+
+# Module-level aliases for the per-frame comparisons (skips the Enum attribute lookup)
+STATE_UP, STATE_DOWN, STATE_RECOVERING, STATE_LEFT, STATE_RIGHT = ExerciseState
+
 
 # --- Helper Functions ---
 
 def calculate_angle(a, b, c):
     """
-    Calculates the angle between three 3D/2D points.
-    a, b, c: Tuples or lists of (x, y, z) or (x, y) coordinates.
+    Calculates the angle between three 3D points.
+    a, b, c: Tuples, lists or landmark rows of (x, y, z) coordinates (z is 0 for YOLO keypoints).
     The angle is calculated at point 'b'.
     """
-    a = np.array(a[:3])  # First point (take max 3 elements)
-    b = np.array(b[:3])  # Mid point (vertex)
-    c = np.array(c[:3])  # End point
+    # Work on plain Python floats: scalar math beats NumPy dispatch on 3-vectors
+    a_x, a_y, a_z = a.tolist() if isinstance(a, np.ndarray) else a
+    b_x, b_y, b_z = b.tolist() if isinstance(b, np.ndarray) else b
+    c_x, c_y, c_z = c.tolist() if isinstance(c, np.ndarray) else c
 
     # Calculate vectors
-    ba = a - b
-    bc = c - b
+    ba_x, ba_y, ba_z = a_x - b_x, a_y - b_y, a_z - b_z
+    bc_x, bc_y, bc_z = c_x - b_x, c_y - b_y, c_z - b_z
 
-    dot_product = np.dot(ba, bc)
-    mag_ba = np.linalg.norm(ba)
-    mag_bc = np.linalg.norm(bc)
+    dot_product = ba_x * bc_x + ba_y * bc_y + ba_z * bc_z
+    # Calculate magnitudes (math.hypot is much cheaper than np.linalg.norm on 3-vectors)
+    mag_ba = math.hypot(ba_x, ba_y, ba_z)
+    mag_bc = math.hypot(bc_x, bc_y, bc_z)
 
     if mag_ba == 0 or mag_bc == 0:
         return 0.0
 
     cosine_angle = dot_product / (mag_ba * mag_bc)
 
-    # Clip values to prevent arccos errors
-    cosine_angle = np.clip(cosine_angle, -1.0, 1.0)
+    # Clip values to prevent acos errors (plain min/max, np.clip is slow on scalars)
+    cosine_angle = max(-1.0, min(1.0, cosine_angle))
 
     # Calculate angle in radians and convert to degrees
-    angle = np.arccos(cosine_angle)
-    return np.degrees(angle)
+    return math.degrees(math.acos(cosine_angle))
 
 
-def get_landmark_coords(landmarks, part_name, image_width, image_height):
+@njit(cache=True)
+def _calculate_angle_jit(a, b, c):
     """
-    Retrieves the pixel coordinates (x, y) of a specific landmark from YOLO output.
-    landmarks: The keypoints array for the primary person, e.g., [[x1, y1, conf1], [x2, y2, conf2], ...]
+    Compiled twin of calculate_angle, used in its place when Numba is installed.
+    Indexes the points directly (tolist/isinstance are not available in nopython mode).
     """
-    if part_name not in YOLO_KEYPOINT_MAP:
-        # In a real app, this should throw an error, but here we return a safe default
-        return (0, 0)
+    ba_x, ba_y, ba_z = float(a[0]) - float(b[0]), float(a[1]) - float(b[1]), float(a[2]) - float(b[2])
+    bc_x, bc_y, bc_z = float(c[0]) - float(b[0]), float(c[1]) - float(b[1]), float(c[2]) - float(b[2])
+
+    dot_product = ba_x * bc_x + ba_y * bc_y + ba_z * bc_z
+    mag_ba = math.sqrt(ba_x * ba_x + ba_y * ba_y + ba_z * ba_z)
+    mag_bc = math.sqrt(bc_x * bc_x + bc_y * bc_y + bc_z * bc_z)
+
+    if mag_ba == 0 or mag_bc == 0:
+        return 0.0
+
+    cosine_angle = dot_product / (mag_ba * mag_bc)
+
+    cosine_angle = max(-1.0, min(1.0, cosine_angle))
+    return math.degrees(math.acos(cosine_angle))
 
-    index = YOLO_KEYPOINT_MAP[part_name]
 
-    # Check if the index is valid for the landmarks array
-    if index >= len(landmarks):
-        return (0, 0)
+# The compiled version beats the pure-Python one even with Numba's call overhead; without
+# Numba it would run on NumPy scalars (slower than the Python version), so keep that instead
+if HAVE_NUMBA:
+    calculate_angle = _calculate_angle_jit
+    # Compile now rather than on the first visible frame (see the warm-up below _angles_from_landmarks);
+    # lm[i, :3] rows of the float32 landmark array are what the processors pass in
+    _dummy_lm = np.zeros((MISSING_KEYPOINT + 1, 4), dtype=np.float32)
+    calculate_angle(_dummy_lm[0, :3], _dummy_lm[1, :3], _dummy_lm[2, :3])
+    del _dummy_lm
+
+
+def angle_triples(*triples):
+    """
+    Packs (a, b, c) landmark index triples into the index array calculate_angles takes.
+    Processors build theirs once at import, so no index array is rebuilt per frame.
+    """
+    return np.array(triples, dtype=np.intp)
 
-    lm = landmarks[index]
 
-    # YOLO keypoints are usually raw pixel coordinates or normalized.
-    # We assume they are raw pixel coords (X, Y) here, which matches how they were used in the old code.
-    return (int(round(lm[0])), int(round(lm[1])))
+def calculate_angles(lm, triples):
+    """
+    Calculates several angles from the landmark array in one call.
+    lm: per-frame landmark array from extract_landmarks.
+    triples: (N, 3) landmark index array from angle_triples; each angle is calculated at point 'b'.
+    Returns a list with one angle (in degrees) per triple, in the same order.
+    """
+    if HAVE_NUMBA:
+        return _angles_from_landmarks(lm, triples).tolist()
+    # Without Numba, plain scalar calls beat NumPy's per-call overhead on a handful of angles
+    return [calculate_angle(lm[a, :3], lm[b, :3], lm[c, :3]) for a, b, c in triples.tolist()]
 
 
-def get_landmark_3d(landmarks, part_name):
+@njit(cache=True)
+def _angles_from_landmarks(lm, triples):
     """
-    Retrieves the proportional coordinates (x, y, z=0) of a specific landmark from YOLO output.
-    We use proportional coordinates (raw pixel values) and set Z=0 to maintain angle calculation compatibility.
+    Numba core of calculate_angles: gathers the points and computes every angle in one
+    compiled loop, so no (N, 3, 3) point array is built per frame.
     """
-    if part_name not in YOLO_KEYPOINT_MAP:
-        return [0, 0, 0]
+    angles = np.empty(triples.shape[0])
+    for i in range(triples.shape[0]):
+        angles[i] = _calculate_angle_jit(lm[triples[i, 0]], lm[triples[i, 1]], lm[triples[i, 2]])
+    return angles
 
-    index = YOLO_KEYPOINT_MAP[part_name]
 
-    if index >= len(landmarks):
-        return [0, 0, 0]
+# Numba compiles on the first call (seconds on a cold cache, and the on-disk cache is lost
+# whenever the source changes or the package directory is read-only). Compile at import
+# instead of on the first frame with a visible person, using a dummy landmark array of the
+# per-frame dtype and shape so calculate_angles hits the same signature later.
+if HAVE_NUMBA:
+    calculate_angles(np.zeros((MISSING_KEYPOINT + 1, 4), dtype=np.float32), angle_triples((0, 1, 2)))
 
-    lm = landmarks[index]
 
-    # Use the raw pixel coordinates as proportional values for angle calculation, and set z to 0.
-    return [lm[0], lm[1], 0]
+def extract_landmarks(landmarks, image_width, image_height):
+    """
+    Converts the YOLO keypoints array ([[x, y, conf], ...] in pixels) into arrays, once per frame.
+    image_width/image_height are unused (YOLO keypoints are already in pixels) but kept so
+    both apps share the same call signature.
+    Returns (lm, lm2):
+      lm:  float32 array of shape (18, 4) holding (x, y, z=0, confidence) per keypoint, plus the
+           all-zero MISSING_KEYPOINT row. Use lm[LM_IDX[name], :3] for the coordinates.
+      lm2: list of (x, y) integer pixel coordinates per keypoint, ready for OpenCV drawing.
+    """
+    lm = np.zeros((MISSING_KEYPOINT + 1, 4), dtype=np.float32)
+    lm[:len(landmarks), :2] = landmarks[:, :2]
+    lm[:len(landmarks), 3] = landmarks[:, 2]
+    lm2 = np.rint(lm[:, :2]).astype(np.int32).tolist()
+    return lm, lm2
 
 
 # --- Skeleton Drawing Function (NEW for YOLO) ---
-def draw_yolo_skeleton(image, landmarks, color=(100, 100, 100), thickness=2, circle_radius=2):
+# Skeleton connections based on COCO keypoint indices, built once at import
+SKELETON_CONNECTIONS = (
+    (LEFT_SHOULDER, LEFT_ELBOW),
+    (LEFT_ELBOW, LEFT_WRIST),
+    (RIGHT_SHOULDER, RIGHT_ELBOW),
+    (RIGHT_ELBOW, RIGHT_WRIST),
+
+    (LEFT_SHOULDER, RIGHT_SHOULDER),
+    (LEFT_SHOULDER, LEFT_HIP),
+    (RIGHT_SHOULDER, RIGHT_HIP),
+    (LEFT_HIP, RIGHT_HIP),
+
+    (LEFT_HIP, LEFT_KNEE),
+    (LEFT_KNEE, LEFT_ANKLE),
+    (RIGHT_HIP, RIGHT_KNEE),
+    (RIGHT_KNEE, RIGHT_ANKLE),
+)
+
+
+def draw_yolo_skeleton(image, lm, lm2, color=(100, 100, 100), thickness=2, circle_radius=2):
     """
-    Draws the generic skeleton on the image from the YOLO keypoints array.
+    Draws the generic skeleton on the image from the per-frame arrays built by extract_landmarks.
     This replaces mp_drawing.draw_landmarks for the base skeleton.
     """
-
-    # Define connections based on COCO keypoint indices
-    connections = [
-        (YOLO_KEYPOINT_MAP["LEFT_SHOULDER"], YOLO_KEYPOINT_MAP["LEFT_ELBOW"]),
-        (YOLO_KEYPOINT_MAP["LEFT_ELBOW"], YOLO_KEYPOINT_MAP["LEFT_WRIST"]),
-        (YOLO_KEYPOINT_MAP["RIGHT_SHOULDER"], YOLO_KEYPOINT_MAP["RIGHT_ELBOW"]),
-        (YOLO_KEYPOINT_MAP["RIGHT_ELBOW"], YOLO_KEYPOINT_MAP["RIGHT_WRIST"]),
-
-        (YOLO_KEYPOINT_MAP["LEFT_SHOULDER"], YOLO_KEYPOINT_MAP["RIGHT_SHOULDER"]),
-        (YOLO_KEYPOINT_MAP["LEFT_SHOULDER"], YOLO_KEYPOINT_MAP["LEFT_HIP"]),
-        (YOLO_KEYPOINT_MAP["RIGHT_SHOULDER"], YOLO_KEYPOINT_MAP["RIGHT_HIP"]),
-        (YOLO_KEYPOINT_MAP["LEFT_HIP"], YOLO_KEYPOINT_MAP["RIGHT_HIP"]),
-
-        (YOLO_KEYPOINT_MAP["LEFT_HIP"], YOLO_KEYPOINT_MAP["LEFT_KNEE"]),
-        (YOLO_KEYPOINT_MAP["LEFT_KNEE"], YOLO_KEYPOINT_MAP["LEFT_ANKLE"]),
-        (YOLO_KEYPOINT_MAP["RIGHT_HIP"], YOLO_KEYPOINT_MAP["RIGHT_KNEE"]),
-        (YOLO_KEYPOINT_MAP["RIGHT_KNEE"], YOLO_KEYPOINT_MAP["RIGHT_ANKLE"]),
-    ]
-
-    keypoint_coords = {}
-    for name, index in YOLO_KEYPOINT_MAP.items():
-        if index < len(landmarks):
-            # Keypoint is [x, y, confidence]
-            if landmarks[index][2] > 0.4:  # Only draw if confidence is reasonable
-                keypoint_coords[index] = (int(landmarks[index][0]), int(landmarks[index][1]))
+    # Only draw keypoints whose confidence is reasonable
+    confident = (lm[:, 3] > 0.4).tolist()
 
     # Draw lines (bones)
-    for p1_idx, p2_idx in connections:
-        if p1_idx in keypoint_coords and p2_idx in keypoint_coords:
-            p1 = keypoint_coords[p1_idx]
-            p2 = keypoint_coords[p2_idx]
-            cv2.line(image, p1, p2, color, thickness)
+    for p1_idx, p2_idx in SKELETON_CONNECTIONS:
+        if confident[p1_idx] and confident[p2_idx]:
+            cv2.line(image, lm2[p1_idx], lm2[p2_idx], color, thickness)
 
     # Draw circles (joints)
-    for index, (x, y) in keypoint_coords.items():
-        cv2.circle(image, (x, y), circle_radius, color, -1)
\ No newline at end of file
+    for index in YOLO_KEYPOINT_MAP.values():
+        if confident[index]:
+            cv2.circle(image, lm2[index], circle_radius, color, -1)